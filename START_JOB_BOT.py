@@ -11,22 +11,41 @@ import os
 import sys
 import subprocess
 
+REQUIRED_PACKAGES = ["beautifulsoup4", "requests", "lxml"]
+
+# Optional local wheelhouse shipped beside the launcher - lets installs
+# run offline in a few hundred ms instead of hitting PyPI
+WHEELHOUSE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "wheelhouse")
+
 def check_dependencies():
     """Check if required packages are installed"""
     try:
         import requests
         import bs4
+        import lxml
         return True
     except ImportError:
         return False
 
 def install_dependencies():
-    """Install required packages"""
+    """Install required packages, preferring the local wheelhouse"""
     print("Installing required packages...")
     print("This may take a moment...")
+    base_cmd = [sys.executable, "-m", "pip", "install",
+                "--disable-pip-version-check"] + REQUIRED_PACKAGES
+
+    # Try the offline wheelhouse first - sub-second and network-free
+    if os.path.isdir(WHEELHOUSE):
+        try:
+            subprocess.run(base_cmd + ["--no-index", "--find-links", WHEELHOUSE],
+                          capture_output=True, check=True)
+            print("✓ Packages installed from local wheelhouse!")
+            return True
+        except subprocess.CalledProcessError:
+            print("Wheelhouse install failed, falling back to network install...")
+
     try:
-        subprocess.run([sys.executable, "-m", "pip", "install", "beautifulsoup4", "requests"], 
-                      capture_output=True, check=True)
+        subprocess.run(base_cmd, capture_output=True, check=True)
         print("✓ Packages installed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -56,7 +75,7 @@ def main():
         if choice in ['y', 'yes']:
             if not install_dependencies():
                 print("\nInstallation failed. Please run manually:")
-                print("pip install beautifulsoup4 requests")
+                print("pip install beautifulsoup4 requests lxml")
                 input("Press Enter to close...")
                 return
         else:
@@ -67,19 +86,41 @@ def main():
     print("✓ All requirements satisfied")
     print("\nStarting Job Bot...")
     print("=" * 60)
-    
-    # Start the main bot
-    try:
-        # Run the bot script directly
-        result = subprocess.run([sys.executable, "job-bot.py"], cwd=os.path.dirname(os.path.abspath(__file__)))
-        if result.returncode != 0:
-            print("✗ Job Bot encountered an error")
-    except FileNotFoundError:
+
+    # Start the main bot in-process - avoids a second Python interpreter
+    # startup and re-importing requests/bs4 from scratch
+    bot_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "job-bot.py")
+    if not os.path.exists(bot_file):
         print("✗ job-bot.py not found in current directory")
         input("Press Enter to close...")
+        return
+
+    job_bot = None
+    try:
+        import importlib.util
+        # Match the old subprocess launch's cwd so Generated_Applications
+        # and the page cache land beside the scripts, not wherever the
+        # launcher happened to be invoked from
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+        spec = importlib.util.spec_from_file_location("job_bot", bot_file)
+        job_bot = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(job_bot)
     except Exception as e:
-        print(f"✗ Error starting Job Bot: {e}")
-        input("Press Enter to close...")
+        # Fall back to the old subprocess launch if the import path breaks
+        print(f"In-process start failed ({e}), retrying as subprocess...")
+        job_bot = None
+
+    if job_bot is not None:
+        job_bot.main()
+    else:
+        try:
+            result = subprocess.run([sys.executable, bot_file],
+                                   cwd=os.path.dirname(os.path.abspath(__file__)))
+            if result.returncode != 0:
+                print("✗ Job Bot encountered an error")
+        except Exception as e:
+            print(f"✗ Error starting Job Bot: {e}")
+            input("Press Enter to close...")
 
 if __name__ == "__main__":
     try:
@@ -12,30 +12,233 @@ Author: Trey (Infrastructure Engineer → AI/Automation Specialist)
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
+import hashlib
+import json
 import os
+import queue
+import re
+import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 import webbrowser
 
-# Import our bot functionality
+# Optional: pyperclip talks to the Win32 clipboard directly, skipping
+# Tk's per-call UTF-16 conversion for large payloads
 try:
-    import requests
-    from bs4 import BeautifulSoup
+    import pyperclip
 except ImportError:
-    messagebox.showerror("Missing Dependencies", 
-                        "Please install required packages:\npip install beautifulsoup4 requests")
-    sys.exit(1)
+    pyperclip = None
+
+# requests + urllib3 + charset_normalizer + certifi cost 100-250ms to
+# import on Windows - enough to delay the window visibly. Load them
+# lazily on first scrape (and prewarm in the background after startup).
+BeautifulSoup = None
+SESSION = None
+CONTENT_TAGS = None
+HTML_PARSER = 'html.parser'
+LXML_HTML = None
+_TITLE_XP = None
+_COMPANY_XP = None
+_DESC_XP = None
+_SCRAPER_LOCK = threading.Lock()
+
+def _load_scraper_libs():
+    """Import requests/bs4 and build the shared session on first use"""
+    global BeautifulSoup, SESSION, CONTENT_TAGS, HTML_PARSER
+    global LXML_HTML, _TITLE_XP, _COMPANY_XP, _DESC_XP
+
+    with _SCRAPER_LOCK:
+        if SESSION is not None:
+            return
 
-# Import our existing bot logic
-import json
-import re
-from datetime import datetime
-from urllib.parse import urlparse
+        try:
+            import requests
+            from bs4 import BeautifulSoup as _BeautifulSoup, SoupStrainer
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+        except ImportError:
+            raise ImportError("Missing packages - please run:\n"
+                              "pip install beautifulsoup4 requests")
+
+        # Prefer raw lxml: C-level parse + precompiled XPath beats BS4's
+        # soupsieve CSS selectors walking a pure-Python tree
+        try:
+            import lxml.html
+            import lxml.etree
+            HTML_PARSER = 'lxml'
+            LXML_HTML = lxml.html
+            _TITLE_XP = lxml.etree.XPath(
+                "(//h1 | //*[@data-testid='jobTitle']"
+                " | //*[contains(@class,'job-title')]"
+                " | //*[contains(@class,'jobsearch-JobInfoHeader-title')])[1]")
+            _COMPANY_XP = lxml.etree.XPath(
+                "(//*[contains(@class,'company-name')]"
+                " | //*[@data-testid='companyName']"
+                " | //*[contains(@class,'jobsearch-InlineCompanyRating')])[1]")
+            _DESC_XP = lxml.etree.XPath(
+                "(//*[@data-testid='jobDescriptionText']"
+                " | //*[@id='jobDescriptionText']"
+                " | //*[contains(@class,'description__text')]"
+                " | //article)[1]")
+        except ImportError:
+            print("Warning: lxml not installed - using slower html.parser (pip install lxml)")
+
+        # Only build tree nodes for tags our selectors and text extraction
+        # actually use - skips scripts, styles, svg, nav chrome etc. at parse time
+        CONTENT_TAGS = SoupStrainer(['h1', 'h2', 'h3', 'a', 'div', 'span', 'section',
+                                     'article', 'p', 'li', 'ul'])
+
+        # Shared session: keep-alive connection pool plus retry/backoff for
+        # the transient 5xx responses job boards like to return
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=3, backoff_factor=0.3,
+                                                status_forcelist=(500, 502, 503, 504)))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+
+        BeautifulSoup = _BeautifulSoup
+        SESSION = session
+
+def _prewarm_scraper_libs():
+    """Background import so the first Generate click isn't slow either"""
+    try:
+        _load_scraper_libs()
+    except ImportError:
+        pass  # surfaced with a proper dialog when the user actually scrapes
+
+# On-disk page cache so repeat generations for the same URL skip the
+# network and go straight to parsing
+CACHE_DIR = Path('.job_bot_cache')
+CACHE_TTL = 3600  # seconds
+
+# Keyword classifier, checked against the extracted description text in
+# priority order - str 'in' is a single C-level scan per keyword
+CATEGORY_KEYWORDS = ('automation', 'infrastructure', 'data')
+
+# Containers job boards use for the posting body; classifying from this
+# text (not the raw HTML) keeps data-* attributes and script junk from
+# matching the category keywords
+DESC_SELECTORS = ('[data-testid="jobDescriptionText"]', '#jobDescriptionText',
+                  '.description__text', 'article')
+
+# Filename slug patterns and timestamp format used on every save
+SLUG_STRIP = re.compile(r'[^\w\s-]')
+SLUG_JOIN = re.compile(r'[-\s]+')
+TIMESTAMP_FMT = "%Y%m%d_%H%M%S"
+
+# Static output templates - ~90% constant text, so build them once at
+# import and only fill the variable slots per job
+COVER_TEMPLATE = """Dear Hiring Manager,
+
+As an Infrastructure Engineer with 3+ years maintaining 99.8% uptime, I'm excited to apply for the {title} position at {company}.
+
+My background uniquely positions me for this role:
+
+• Infrastructure Foundation: Linux/Windows server management with focus on reliability and monitoring
+• Automation Growth: Python development including GitHub API integration and content generation systems
+• Current Learning: Building Memory Platform - AI-powered family connection app with data analysis components
+
+{memory_connection}
+
+Recent accomplishments that demonstrate my Infrastructure → AI transition:
+• GitHub Development Logger Bot (Python, APIs, content automation)
+• Memory Platform development (AI, data processing, user experience)
+• Infrastructure monitoring with 99.8% uptime achievement
+
+Like my current project building the Memory Platform (an AI-powered family connection app), I approach challenges by combining solid infrastructure knowledge with innovative automation solutions.
+
+I'd welcome the opportunity to discuss how my infrastructure expertise and growing automation skills can contribute to {company}'s success.
+
+Best regards,
+Trey
+
+Portfolio: https://tanarius.github.io
+GitHub: https://github.com/Tanarius
+Memory Platform: AI-powered family connections through technology"""
+
+TALKING_POINTS_TEMPLATE = """KEY TALKING POINTS FOR INTERVIEW:
+
+Company: {company}
+Position: {title}
+
+1. INFRASTRUCTURE STABILITY
+   - 99.8% uptime track record demonstrates reliability
+   - Experience with Linux/Windows server management
+   - Strong foundation in system monitoring and maintenance
+
+2. AUTOMATION DEVELOPMENT
+   - Built production GitHub integration bot (Python, APIs)
+   - Content generation and automation systems
+   - Practical experience with API development
+
+3. AI TRANSITION JOURNEY
+   - Actively building Memory Platform using machine learning
+   - Data processing and analysis components
+   - Shows commitment to staying current with technology
+
+4. GROWTH MINDSET
+   - Choosing to transition into AI shows adaptability
+   - Learning new technologies while maintaining core strengths
+   - Perfect fit for companies needing both stability and innovation
+
+5. MEMORY PLATFORM CONNECTION
+   - Demonstrates end-to-end thinking from infrastructure to AI
+   - Real-world application of technical skills
+   - Shows ability to build complete solutions
+
+PORTFOLIO LINKS TO MENTION:
+• Portfolio: https://tanarius.github.io
+• GitHub: https://github.com/Tanarius
+• Recent Project: GitHub Development Logger Bot
+• Current Project: Memory Platform (AI family connections)
+
+QUESTIONS TO ASK THEM:
+• What automation challenges is your infrastructure team facing?
+• How is your company approaching AI integration?
+• What opportunities exist for process improvement?
+• How does this role contribute to the company's technical evolution?"""
+
+MEMORY_CONNECTIONS = {
+    'automation': "Like building the Memory Platform to automate family connection discovery, I focus on creating systems that solve real problems through intelligent automation.",
+    'infrastructure': "The Memory Platform requires solid infrastructure to handle family data securely - same foundation thinking I'd bring to your infrastructure challenges.",
+    'data': "Memory Platform processes family stories into meaningful insights - similar data transformation skills I'd apply to your business challenges.",
+    None: "My Memory Platform project demonstrates end-to-end thinking: from infrastructure through AI implementation - the comprehensive approach valuable for any technical role.",
+}
+
+class JobCancelled(Exception):
+    """Raised inside the worker when the user cancels an in-flight job"""
 
 class JobBotGUI:
     def __init__(self, root):
         self.root = root
         self.setup_window()
+
+        # Created once at startup so save/open never pay the stat+mkdir
+        # (surprisingly slow on cloud-synced folders like OneDrive)
+        self.apps_folder = Path("Generated_Applications").resolve()
+        self.apps_folder.mkdir(exist_ok=True)
+
+        # Reused for content generation - no per-click thread-spawn cost,
+        # and a ready-made home for future multi-URL batch mode
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+        # One persistent worker pulling URLs off a queue - no per-click
+        # thread creation, and in-flight scrapes can actually be cancelled
+        self._jobs = queue.Queue()
+        # Cancel token of the most recently queued job; each job carries
+        # its own Event so cancelling one can never leak into the next
+        self._cancel = threading.Event()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
         self.create_widgets()
         self.processing = False
         
@@ -97,9 +300,13 @@ class JobBotGUI:
         self.url_entry = ttk.Entry(url_frame, textvariable=self.url_var, font=('Arial', 10))
         self.url_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 10))
         
-        self.generate_btn = ttk.Button(url_frame, text="Generate Application", 
+        self.generate_btn = ttk.Button(url_frame, text="Generate Application",
                                       command=self.start_processing)
         self.generate_btn.grid(row=0, column=2)
+
+        self.cancel_btn = ttk.Button(url_frame, text="Cancel",
+                                     command=self.cancel_processing, state='disabled')
+        self.cancel_btn.grid(row=0, column=3, padx=(5, 0))
         
         # Examples
         examples_frame = ttk.Frame(url_frame)
@@ -224,27 +431,53 @@ class JobBotGUI:
         # Start processing
         self.processing = True
         self.generate_btn.config(state='disabled')
+        self.cancel_btn.config(state='normal')
         self.progress.start()
-        
-        # Run in background thread
-        thread = threading.Thread(target=self.process_job, args=(url,))
-        thread.daemon = True
-        thread.start()
-    
-    def process_job(self, url):
+
+        # Hand the URL to the persistent worker with a fresh cancel
+        # token - clearing a shared event here could erase a
+        # cancellation the previous job's loop hasn't seen yet
+        token = threading.Event()
+        self._cancel = token
+        self._jobs.put((url, token))
+
+    def cancel_processing(self):
+        """Abort the in-flight scrape"""
+        if self.processing:
+            self._cancel.set()
+            self.status_var.set("Cancelling...")
+
+    def _worker_loop(self):
+        """Persistent worker - pulls URLs off the queue until shutdown"""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            url, cancel = job
+            self.process_job(url, cancel)
+
+    def shutdown_worker(self):
+        """Stop the worker promptly: abort any scrape, then send the sentinel"""
+        self._cancel.set()
+        self._jobs.put(None)
+
+    def process_job(self, url, cancel):
         """Process job in background thread"""
         try:
             # Update status
             self.root.after(0, lambda: self.status_var.set("Reading job posting..."))
             
             # Scrape job
-            job_data = self.scrape_job(url)
+            job_data = self.scrape_job(url, cancel)
             
             self.root.after(0, lambda: self.status_var.set("Generating personalized content..."))
-            
-            # Generate content
-            cover_letter = self.generate_cover_letter(job_data)
-            talking_points = self.generate_talking_points(job_data)
+
+            # The two generators are independent - run them on the shared
+            # executor instead of serially
+            cl_future = self._executor.submit(self.generate_cover_letter, job_data)
+            tp_future = self._executor.submit(self.generate_talking_points, job_data)
+            cover_letter = cl_future.result()
+            talking_points = tp_future.result()
             
             # Store results
             results = {
@@ -255,156 +488,166 @@ class JobBotGUI:
             
             # Update GUI in main thread
             self.root.after(0, lambda: self.display_results(results))
-            
+
+        except JobCancelled:
+            self.root.after(0, self.handle_cancelled)
         except Exception as e:
             self.root.after(0, lambda: self.handle_error(str(e)))
     
-    def scrape_job(self, url):
+    def scrape_job(self, url, cancel):
         """Scrape job posting - simplified version"""
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(url, headers=headers, timeout=15)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
+        _load_scraper_libs()
+
+        body = self.load_cached_page(url)
+
+        if body is None:
+            # Stream the body in 64KB chunks instead of letting requests
+            # buffer it through its small internal chunk size
+            response = SESSION.get(url, stream=True, timeout=(5, 15))
+            buf = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                if cancel.is_set():
+                    response.close()
+                    raise JobCancelled()
+                buf.extend(chunk)
+            response.close()
+            body = bytes(buf)
+            self.store_cached_page(url, body)
+
         # Extract basic info
         title = "Job Position"
         company = "Company"
-        
-        # Try to find title
-        title_selectors = ['h1', '[data-testid="jobTitle"]', '.job-title', '.jobsearch-JobInfoHeader-title']
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                title = element.get_text().strip()
-                break
-        
-        # Try to find company
-        company_selectors = ['.company-name', '[data-testid="companyName"]', '.jobsearch-InlineCompanyRating']
-        for selector in company_selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                company = element.get_text().strip()
+
+        if LXML_HTML is not None:
+            # Fast path: one C-level parse, precompiled XPath lookups,
+            # and text_content() is a single C call per node
+            tree = LXML_HTML.fromstring(body)
+
+            element = _TITLE_XP(tree)
+            if element and element[0].text_content().strip():
+                title = element[0].text_content().strip()
+
+            element = _COMPANY_XP(tree)
+            if element and element[0].text_content().strip():
+                company = element[0].text_content().strip()
+
+            element = _DESC_XP(tree)
+            desc_node = element[0] if element else tree
+            desc_text = desc_node.text_content()
+        else:
+            soup = BeautifulSoup(body, HTML_PARSER, parse_only=CONTENT_TAGS)
+
+            # Try to find title
+            title_selectors = ['h1', '[data-testid="jobTitle"]', '.job-title', '.jobsearch-JobInfoHeader-title']
+            for selector in title_selectors:
+                element = soup.select_one(selector)
+                if element and element.get_text().strip():
+                    title = element.get_text().strip()
+                    break
+
+            # Try to find company
+            company_selectors = ['.company-name', '[data-testid="companyName"]', '.jobsearch-InlineCompanyRating']
+            for selector in company_selectors:
+                element = soup.select_one(selector)
+                if element and element.get_text().strip():
+                    company = element.get_text().strip()
+                    break
+
+            desc_element = None
+            for selector in DESC_SELECTORS:
+                desc_element = soup.select_one(selector)
+                if desc_element:
+                    break
+            desc_text = (desc_element or soup).get_text(" ", strip=True)
+
+        # Classify from the extracted description text - matching the raw
+        # HTML would hit data-* attributes and script text on essentially
+        # every page and skew the letters toward the 'data' paragraph
+        desc_lower = desc_text.lower()
+        for keyword in CATEGORY_KEYWORDS:
+            if keyword in desc_lower:
+                category = keyword
                 break
-        
-        # Get description
-        description = soup.get_text().lower()
-        
+        else:
+            category = None
+
         return {
             'title': title,
             'company': company,
-            'description': description,
+            'category': category,
             'url': url
         }
     
-    def generate_cover_letter(self, job_data):
-        """Generate cover letter - same logic as CLI version"""
-        description = job_data['description']
-        
-        # Memory Platform connections based on job type
-        if 'automation' in description:
-            memory_connection = "Like building the Memory Platform to automate family connection discovery, I focus on creating systems that solve real problems through intelligent automation."
-        elif 'infrastructure' in description:
-            memory_connection = "The Memory Platform requires solid infrastructure to handle family data securely - same foundation thinking I'd bring to your infrastructure challenges."
-        elif 'data' in description:
-            memory_connection = "Memory Platform processes family stories into meaningful insights - similar data transformation skills I'd apply to your business challenges."
-        else:
-            memory_connection = "My Memory Platform project demonstrates end-to-end thinking: from infrastructure through AI implementation - the comprehensive approach valuable for any technical role."
-        
-        cover_letter = f"""Dear Hiring Manager,
-
-As an Infrastructure Engineer with 3+ years maintaining 99.8% uptime, I'm excited to apply for the {job_data['title']} position at {job_data['company']}.
-
-My background uniquely positions me for this role:
-
-• Infrastructure Foundation: Linux/Windows server management with focus on reliability and monitoring
-• Automation Growth: Python development including GitHub API integration and content generation systems  
-• Current Learning: Building Memory Platform - AI-powered family connection app with data analysis components
-
-{memory_connection}
-
-Recent accomplishments that demonstrate my Infrastructure → AI transition:
-• GitHub Development Logger Bot (Python, APIs, content automation)
-• Memory Platform development (AI, data processing, user experience)
-• Infrastructure monitoring with 99.8% uptime achievement
+    def cache_path_for(self, url):
+        """Cache file path for a job URL"""
+        return CACHE_DIR / hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
 
-Like my current project building the Memory Platform (an AI-powered family connection app), I approach challenges by combining solid infrastructure knowledge with innovative automation solutions.
-
-I'd welcome the opportunity to discuss how my infrastructure expertise and growing automation skills can contribute to {job_data['company']}'s success.
-
-Best regards,
-Trey
+    def load_cached_page(self, url):
+        """Return cached page bytes if fresh, else None"""
+        try:
+            cache_path = self.cache_path_for(url)
+            if cache_path.exists() and time.time() - cache_path.stat().st_mtime < CACHE_TTL:
+                return cache_path.read_bytes()
+        except OSError:
+            pass
+        return None
 
-Portfolio: https://tanarius.github.io
-GitHub: https://github.com/Tanarius
-Memory Platform: AI-powered family connections through technology"""
+    def store_cached_page(self, url, body):
+        """Store page bytes in the disk cache (best effort)"""
+        try:
+            CACHE_DIR.mkdir(exist_ok=True)
+            self.cache_path_for(url).write_bytes(body)
+        except OSError:
+            pass
 
-        return cover_letter
+    def generate_cover_letter(self, job_data):
+        """Generate cover letter - same logic as CLI version"""
+        # Memory Platform connection comes from the category scrape_job
+        # already classified - no rescanning of the description here
+        return COVER_TEMPLATE.format_map({
+            'title': job_data['title'],
+            'company': job_data['company'],
+            'memory_connection': MEMORY_CONNECTIONS[job_data.get('category')],
+        })
     
     def generate_talking_points(self, job_data):
         """Generate talking points for interviews"""
-        points = f"""KEY TALKING POINTS FOR INTERVIEW:
-
-Company: {job_data['company']}
-Position: {job_data['title']}
-
-1. INFRASTRUCTURE STABILITY
-   - 99.8% uptime track record demonstrates reliability
-   - Experience with Linux/Windows server management
-   - Strong foundation in system monitoring and maintenance
-
-2. AUTOMATION DEVELOPMENT
-   - Built production GitHub integration bot (Python, APIs)
-   - Content generation and automation systems
-   - Practical experience with API development
-
-3. AI TRANSITION JOURNEY
-   - Actively building Memory Platform using machine learning
-   - Data processing and analysis components
-   - Shows commitment to staying current with technology
-
-4. GROWTH MINDSET
-   - Choosing to transition into AI shows adaptability
-   - Learning new technologies while maintaining core strengths
-   - Perfect fit for companies needing both stability and innovation
-
-5. MEMORY PLATFORM CONNECTION
-   - Demonstrates end-to-end thinking from infrastructure to AI
-   - Real-world application of technical skills
-   - Shows ability to build complete solutions
-
-PORTFOLIO LINKS TO MENTION:
-• Portfolio: https://tanarius.github.io
-• GitHub: https://github.com/Tanarius  
-• Recent Project: GitHub Development Logger Bot
-• Current Project: Memory Platform (AI family connections)
-
-QUESTIONS TO ASK THEM:
-• What automation challenges is your infrastructure team facing?
-• How is your company approaching AI integration?
-• What opportunities exist for process improvement?
-• How does this role contribute to the company's technical evolution?"""
-
-        return points
+        return TALKING_POINTS_TEMPLATE.format_map({
+            'company': job_data['company'],
+            'title': job_data['title'],
+        })
     
+    def fill_text_widget(self, widget, text):
+        """Replace a text widget's content in one bulk insert
+
+        Toggling state around the update keeps the widget read-only
+        between fills and skips Tk's undo-stack bookkeeping; a single
+        insert means one re-layout instead of one per fragment.
+        """
+        widget.config(state='normal', autoseparators=False)
+        widget.delete('1.0', 'end')
+        widget.insert('1.0', text)
+        widget.edit_reset()
+        widget.config(state='disabled', autoseparators=True)
+
     def display_results(self, results):
         """Display results in GUI"""
         self.current_results = results
-        
+
         # Stop progress and update status
         self.progress.stop()
         self.status_var.set(f"Successfully generated content for {results['job_data']['company']}")
-        
+
         # Enable buttons
         self.generate_btn.config(state='normal')
+        self.cancel_btn.config(state='disabled')
         self.save_btn.config(state='normal')
         self.folder_btn.config(state='normal')
         self.copy_btn.config(state='normal')
-        
+
         # Clear and populate text areas
-        self.cover_letter_text.delete(1.0, tk.END)
-        self.cover_letter_text.insert(1.0, results['cover_letter'])
-        
-        self.talking_points_text.delete(1.0, tk.END)
-        self.talking_points_text.insert(1.0, results['talking_points'])
+        self.fill_text_widget(self.cover_letter_text, results['cover_letter'])
+        self.fill_text_widget(self.talking_points_text, results['talking_points'])
         
         job_analysis = f"""JOB ANALYSIS SUMMARY
 
@@ -437,79 +680,98 @@ This application naturally mentions your Memory Platform project to:
 4. Position you as innovative but grounded
 
 Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
-        
-        self.job_details_text.delete(1.0, tk.END)
-        self.job_details_text.insert(1.0, job_analysis)
+
+        self.fill_text_widget(self.job_details_text, job_analysis)
         
         # Switch to cover letter tab
         self.notebook.select(0)
         
         self.processing = False
     
+    def handle_cancelled(self):
+        """Reset the UI after the user aborts a scrape"""
+        self.progress.stop()
+        self.status_var.set("Cancelled - ready for another URL")
+        self.generate_btn.config(state='normal')
+        self.cancel_btn.config(state='disabled')
+        self.processing = False
+
     def handle_error(self, error_msg):
         """Handle processing errors"""
         self.progress.stop()
         self.status_var.set("Error processing job posting")
         self.generate_btn.config(state='normal')
+        self.cancel_btn.config(state='disabled')
         self.processing = False
         
         messagebox.showerror("Processing Error", 
                            f"Could not process job posting:\n\n{error_msg}\n\nTry a different URL or check your internet connection.")
     
     def save_files(self):
-        """Save files to Generated_Applications folder"""
+        """Save files to Generated_Applications folder (in background)"""
         if not self.current_results:
             return
-        
+
+        # Disk writes (and OneDrive-synced folders especially) can stall
+        # for hundreds of ms - keep them off the Tk main thread
+        thread = threading.Thread(target=self._save_files_worker,
+                                  args=(self.current_results, self.apps_folder))
+        thread.daemon = True
+        thread.start()
+
+    def _save_files_worker(self, results, apps_folder):
+        """Write cover letter, talking points and JSON on a worker thread"""
         try:
-            # Create folder
-            apps_folder = Path("Generated_Applications")
-            apps_folder.mkdir(exist_ok=True)
-            
             # Generate filenames
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            company_clean = re.sub(r'[^\w\s-]', '', self.current_results['job_data']['company']).strip()
-            company_clean = re.sub(r'[-\s]+', '_', company_clean)
-            
+            timestamp = datetime.now().strftime(TIMESTAMP_FMT)
+            company_clean = SLUG_JOIN.sub('_', SLUG_STRIP.sub('', results['job_data']['company']).strip())
+
             # Save cover letter
             cover_letter_file = apps_folder / f"application_{company_clean}_{timestamp}_cover_letter.txt"
             with open(cover_letter_file, 'w', encoding='utf-8') as f:
-                f.write(self.current_results['cover_letter'])
-            
+                f.write(results['cover_letter'])
+
             # Save talking points
             talking_points_file = apps_folder / f"application_{company_clean}_{timestamp}_talking_points.txt"
             with open(talking_points_file, 'w', encoding='utf-8') as f:
-                f.write(self.current_results['talking_points'])
-            
+                f.write(results['talking_points'])
+
             # Save full data
             data_file = apps_folder / f"application_{company_clean}_{timestamp}_full_data.json"
             with open(data_file, 'w', encoding='utf-8') as f:
                 json.dump({
-                    'job_data': self.current_results['job_data'],
-                    'cover_letter': self.current_results['cover_letter'],
-                    'talking_points': self.current_results['talking_points'],
+                    'job_data': results['job_data'],
+                    'cover_letter': results['cover_letter'],
+                    'talking_points': results['talking_points'],
                     'generated_at': datetime.now().isoformat()
-                }, f, indent=2)
-            
-            messagebox.showinfo("Files Saved", 
-                              f"Application content saved to Generated_Applications folder:\n\n"
-                              f"• {cover_letter_file.name}\n"
-                              f"• {talking_points_file.name}\n"
-                              f"• {data_file.name}")
-            
+                }, f, indent=2, ensure_ascii=False)
+
+            self.root.after(0, lambda: messagebox.showinfo(
+                "Files Saved",
+                f"Application content saved to Generated_Applications folder:\n\n"
+                f"• {cover_letter_file.name}\n"
+                f"• {talking_points_file.name}\n"
+                f"• {data_file.name}"))
+
         except Exception as e:
-            messagebox.showerror("Save Error", f"Could not save files: {e}")
+            self.root.after(0, lambda e=e: messagebox.showerror(
+                "Save Error", f"Could not save files: {e}"))
     
     def open_folder(self):
         """Open the Generated_Applications folder"""
         try:
-            folder_path = Path("Generated_Applications")
-            folder_path.mkdir(exist_ok=True)
-            
-            if os.name == 'nt':  # Windows
+            folder_path = self.apps_folder
+
+            if os.name == 'nt':  # Windows (startfile is already non-blocking)
                 os.startfile(folder_path)
             elif os.name == 'posix':  # macOS and Linux
-                os.system(f'open "{folder_path}"')
+                # No shell, no wait - the file manager launches without
+                # freezing the Tk main loop
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                subprocess.Popen([opener, str(folder_path)],
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL,
+                                 close_fds=True)
         except Exception as e:
             messagebox.showerror("Error", f"Could not open folder: {e}")
     
@@ -518,8 +780,15 @@ Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
         if not self.current_results:
             return
             
-        self.root.clipboard_clear()
-        self.root.clipboard_append(self.current_results['cover_letter'])
+        text = self.current_results['cover_letter']
+        if sys.platform == 'win32' and pyperclip is not None:
+            pyperclip.copy(text)
+        else:
+            self.root.clipboard_clear()
+            # No explicit type: Tk then offers UTF8_STRING, which the
+            # letter's bullet and arrow characters need to survive paste
+            self.root.clipboard_append(text)
+            self.root.update()  # one flush to the clipboard owner
         messagebox.showinfo("Copied", "Cover letter copied to clipboard!")
     
     def show_about(self):
@@ -561,12 +830,19 @@ def main():
     def on_closing():
         if app.processing:
             if messagebox.askokcancel("Processing", "Job Bot is still processing. Close anyway?"):
+                app.shutdown_worker()
                 root.destroy()
         else:
+            app.shutdown_worker()
             root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
-    
+
+    # Once the window is up, import the heavy scraping libs in the
+    # background so the first Generate click doesn't pay for them
+    root.after(50, lambda: threading.Thread(target=_prewarm_scraper_libs,
+                                            daemon=True).start())
+
     # Start the GUI
     root.mainloop()
 
@@ -3,42 +3,211 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import sys
 import os
-import threading
+import datetime
+import functools
+import hashlib
+import json
 import subprocess
-import requests
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+# Optional: orjson encodes ~3x faster than the stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The AI engine drags in requests and the whole analysis stack -
+# seconds of import time that would keep the window from appearing.
+# Loaded lazily on first use and prewarmed in the background.
+SESSION = None
+SmartJobHunterAI = None
+JobAnalysis = None
+_AI_LOCK = threading.Lock()
+_AI_IMPORT_FAILED = False
+
+def _load_ai_engine():
+    """Import the AI engine and build the pooled session on first use"""
+    global SESSION, SmartJobHunterAI, JobAnalysis, _AI_IMPORT_FAILED
+
+    with _AI_LOCK:
+        if SmartJobHunterAI is not None or _AI_IMPORT_FAILED:
+            return
 
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+        import atexit
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # Shared session: pooled keep-alive connections skip the TCP+TLS
+        # handshake on repeat fetches to the same job board, with
+        # retry/backoff for transient failures
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['User-Agent'] = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                                         'AppleWebKit/537.36')
+        atexit.register(session.close)
+        SESSION = session
+
+        sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+        try:
+            import smart_job_hunter_ai
+            from smart_job_hunter_ai import SmartJobHunterAI as _ai_cls, JobAnalysis as _analysis_cls
+            # The AI module calls requests.get directly; point it at the
+            # pooled session (same .get/.post surface) so its fetches
+            # reuse connections
+            smart_job_hunter_ai.requests = session
+            SmartJobHunterAI = _ai_cls
+            JobAnalysis = _analysis_cls
+        except ImportError:
+            _AI_IMPORT_FAILED = True
+
+# Resolved once - the action methods used to rebuild these with nested
+# os.path.dirname calls on every click
+HERE = Path(__file__).resolve().parent
+ROOT = HERE.parent
+PROJECT_ROOT = ROOT.parent
+COMMANDER_GUI = HERE / "ai_commander_gui.py"
+INTERVIEW_GUI = PROJECT_ROOT / "07-INTERVIEW-PREP-AI" / "gui" / "simple-interview-gui.py"
+LEARNING_GUI = PROJECT_ROOT / "06-LEARNING-COACH" / "gui" / "learning_coach_gui.py"
+SAVES_DIR = ROOT / "saves"
+
+# Analysis cache: repeat lookups of a URL skip the re-scrape and the
+# AI re-analysis entirely. Memory side is a small LRU; disk side lives
+# under saves/ so results survive restarts.
+CACHE_LIMIT = 128
+CACHE_DIR = SAVES_DIR / "analysis_cache"
 
 try:
-    from smart_job_hunter_ai import SmartJobHunterAI
-except ImportError as e:
-    SmartJobHunterAI = None
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)  # also creates saves/
+except OSError:
+    pass
+
+BULLET = "• "
+NL = "\n"
+
+def _bullets(seq, n=10):
+    """Bulleted list text: generator join, no throwaway list"""
+    return NL.join(BULLET + s for s in seq[:n])
+
+@functools.lru_cache(maxsize=256)
+def _company_intel(industry, company_size, job_type, culture_insights=""):
+    """Formatted company-intelligence block
+
+    Memoized: the inputs only change when a genuinely new company is
+    analyzed, so cached re-displays skip the rebuild entirely.
+    """
+    company_info = f"""🏢 COMPANY INTELLIGENCE:
+• Industry: {industry.title()}
+• Company Size: {company_size.replace('_', ' ').title()}
+• Work Environment: {job_type.title()} position
+• Growth Stage: Established (based on job posting analysis)"""
+
+    if culture_insights:
+        company_info += f"\n• Culture Insights: {culture_insights}"
+
+    return company_info
+
+def _score_tag(score):
+    """Colour tag for a 0-100 score"""
+    if score >= 75:
+        return 'score_good'
+    if score >= 50:
+        return 'score_mid'
+    return 'score_low'
+
+def normalize_job_url(url):
+    """Canonical cache key: lowercase host, tracking params stripped"""
+    parts = urlparse(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if not k.startswith('utm_')]
+    return urlunparse((parts.scheme.lower(), parts.netloc.lower(), parts.path,
+                       parts.params, urlencode(query), ''))
 
 class SimpleJobHunterGUI:
+    # Dark-theme style table, frozen at class level
+    _STYLE_TABLE = (
+        ('TFrame', {'background': '#1e1e1e'}),
+        ('TLabel', {'background': '#1e1e1e', 'foreground': '#ffffff'}),
+        ('TButton', {'background': '#238636', 'foreground': '#ffffff',
+                     'font': ('Segoe UI', 10, 'bold')}),
+        ('TEntry', {'fieldbackground': '#2d2d2d', 'foreground': '#ffffff'}),
+    )
+
+    # URL token -> (company, job title) for demo mode
+    _DEMO_MAP = {
+        "google": ("Google", "Senior Software Engineer"),
+        "linkedin": ("LinkedIn Company", "Software Engineer"),
+        "indeed": ("Indeed Company", "Software Engineer"),
+    }
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Find & Apply to Jobs")
         self.root.geometry("1000x700")
         self.root.configure(bg='#1e1e1e')
         
-        self.job_hunter = SmartJobHunterAI() if SmartJobHunterAI else None
+        self._analysis_cache = OrderedDict()
+        self._loaded_modules = {}
+        self.current_analysis = None
+
+        # One small executor instead of a fresh thread per click; the
+        # current Future is tracked so a new URL supersedes an old one
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="jobhunter")
+        self._current_future = None
+        self._pending = None
+        self._last_click = 0.0
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # On POSIX, Tk can watch a file descriptor: workers write one
+        # byte to a pipe when done and Tk wakes immediately, instead of
+        # the 50ms root.after polling used on Windows
+        self._wake_r = self._wake_w = None
+        if hasattr(self.root.tk, 'createfilehandler'):
+            self._wake_r, self._wake_w = os.pipe()
+            self.root.tk.createfilehandler(self._wake_r, tk.READABLE, self._on_wake)
+
         self.setup_styles()
         self.create_interface()
+
+        # Warm the AI engine once the window is up so the first click
+        # doesn't pay the import cost
+        threading.Thread(target=lambda: self.job_hunter, daemon=True).start()
+
+    @functools.cached_property
+    def job_hunter(self):
+        """AI engine, imported and instantiated on first access"""
+        _load_ai_engine()
+        return SmartJobHunterAI() if SmartJobHunterAI else None
+
+    def _on_wake(self, fd, mask):
+        """Tk file-handler callback: a worker signalled completion"""
+        os.read(self._wake_r, 4096)  # drain
+        if self._pending is not None:
+            self._poll_future(*self._pending)
+
+    def _on_close(self):
+        """Shut the executor down without waiting on in-flight work"""
+        if self._wake_r is not None:
+            self.root.tk.deletefilehandler(self._wake_r)
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+        self._executor.shutdown(wait=False)
+        self.root.destroy()
     
     def setup_styles(self):
         """Setup clean dark theme"""
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        colors = {
-            'bg': '#1e1e1e', 'fg': '#ffffff', 'entry_bg': '#2d2d2d',
-            'button_bg': '#238636', 'frame_bg': '#2d2d2d'
-        }
-        
-        style.configure('TFrame', background=colors['bg'])
-        style.configure('TLabel', background=colors['bg'], foreground=colors['fg'])
-        style.configure('TButton', background=colors['button_bg'], foreground=colors['fg'], font=('Segoe UI', 10, 'bold'))
-        style.configure('TEntry', fieldbackground=colors['entry_bg'], foreground=colors['fg'])
+        self._style = ttk.Style()
+        self._style.theme_use('clam')
+        for name, opts in self._STYLE_TABLE:
+            self._style.configure(name, **opts)
     
     def create_interface(self):
         """Create simple 3-step interface"""
@@ -57,11 +226,13 @@ class SimpleJobHunterGUI:
         url_frame = ttk.Frame(step1_frame)
         url_frame.pack(fill='x', pady=(10, 0))
         
-        self.url_entry = ttk.Entry(url_frame, font=('Segoe UI', 12))
+        self.url_var = tk.StringVar()
+        self.url_entry = ttk.Entry(url_frame, textvariable=self.url_var, font=('Segoe UI', 12))
         self.url_entry.pack(side='left', fill='x', expand=True, padx=(0, 10))
+        self.url_entry.bind('<Return>', lambda e: self.analyze_job())
         
-        analyze_btn = ttk.Button(url_frame, text="Analyze Job", command=self.analyze_job)
-        analyze_btn.pack(side='right')
+        self.analyze_btn = ttk.Button(url_frame, text="Analyze Job", command=self.analyze_job)
+        self.analyze_btn.pack(side='right')
         
         # Step 2: Results (side by side)
         step2_frame = ttk.Frame(self.root)
@@ -79,8 +250,9 @@ class SimpleJobHunterGUI:
         
         tk.Label(left_frame, text="Job Details", font=('Segoe UI', 12, 'bold'), 
                 bg='#1e1e1e', fg='#ffffff').pack(anchor='w')
-        self.job_info = scrolledtext.ScrolledText(left_frame, height=12, wrap='word', 
-                                                 font=('Segoe UI', 10))
+        self.job_info = scrolledtext.ScrolledText(left_frame, height=12, wrap='word',
+                                                 font=('Segoe UI', 10),
+                                                 undo=False, autoseparators=False, maxundo=0)
         self.job_info.pack(fill='both', expand=True, pady=(5, 0))
         
         # Right side - AI Analysis
@@ -90,8 +262,17 @@ class SimpleJobHunterGUI:
         tk.Label(right_frame, text="AI Analysis & Fit Score", font=('Segoe UI', 12, 'bold'),
                 bg='#1e1e1e', fg='#ffffff').pack(anchor='w')
         self.analysis_info = scrolledtext.ScrolledText(right_frame, height=12, wrap='word',
-                                                      font=('Segoe UI', 10))
+                                                      font=('Segoe UI', 10),
+                                                      undo=False, autoseparators=False, maxundo=0)
         self.analysis_info.pack(fill='both', expand=True, pady=(5, 0))
+
+        # Configured once: Tk caches font metrics per tag, and the score
+        # colouring comes free with the tagged insert
+        self.analysis_info.tag_configure('header', font=('Segoe UI', 11, 'bold'),
+                                         foreground='#58a6ff')
+        self.analysis_info.tag_configure('score_good', foreground='#238636')
+        self.analysis_info.tag_configure('score_mid', foreground='#d29922')
+        self.analysis_info.tag_configure('score_low', foreground='#f85149')
         
         # Step 3: Actions
         step3_frame = ttk.Frame(self.root)
@@ -109,60 +290,152 @@ class SimpleJobHunterGUI:
                   command=self.practice_interview).pack(side='left', padx=(0, 10))
         ttk.Button(actions_frame, text="Find Learning Resources", 
                   command=self.find_learning).pack(side='left', padx=(0, 10))
-        ttk.Button(actions_frame, text="Save Analysis", 
+        ttk.Button(actions_frame, text="Save Analysis",
                   command=self.save_analysis).pack(side='left')
+
+        # Window opens ready for a paste + Enter
+        self.url_entry.focus_set()
     
     def analyze_job(self):
         """Analyze job posting"""
-        url = self.url_entry.get().strip()
+        url = self.url_var.get().strip()
         if not url:
             messagebox.showwarning("Warning", "Please enter a job URL")
             return
-        
-        # Clear previous results
-        self.job_info.delete(1.0, tk.END)
-        self.analysis_info.delete(1.0, tk.END)
-        
+
+        # Coalesce accidental double-clicks
+        now = time.monotonic()
+        if now - self._last_click < 0.3:
+            return
+        self._last_click = now
+
+        # Cache hit renders instantly - no thread, no network, no AI
+        cache_key = normalize_job_url(url)
+        cached = self._cached_analysis(cache_key)
+        if cached is not None:
+            self.display_results(cached)
+            return
+
+        # One analysis at a time - re-enabled when a result or error lands
+        self.analyze_btn.state(['disabled'])
+
         # Show loading
-        self.job_info.insert(tk.END, "Analyzing job posting...\n\nThis may take a moment.")
-        self.analysis_info.insert(tk.END, "Running AI analysis...\n\nPlease wait.")
-        
-        def analyze():
-            try:
-                if not self.job_hunter:
-                    # Demo mode - create mock analysis
-                    self.root.after(0, self.show_demo_analysis, url)
-                else:
-                    analysis = self.job_hunter.analyze_job_opportunity(url)
-                    if analysis:
-                        self.root.after(0, self.display_results, analysis)
-                    else:
-                        self.root.after(0, self.show_error, "Could not analyze job")
-            except Exception as e:
-                self.root.after(0, self.show_error, f"Analysis failed: {str(e)}")
-        
-        threading.Thread(target=analyze, daemon=True).start()
-    
+        self._blit("Analyzing job posting...\n\nThis may take a moment.",
+                   "Running AI analysis...\n\nPlease wait.")
+
+        if not self.job_hunter:
+            # Demo mode - create mock analysis
+            self.root.after(0, self.show_demo_analysis, url)
+            return
+
+        # Submit to the shared executor and poll the Future from the Tk
+        # main loop - all UI updates stay on the main thread
+        if self._current_future is not None and not self._current_future.done():
+            self._current_future.cancel()
+        future = self._executor.submit(self._analyze_and_format, url)
+        self._current_future = future
+        self._pending = (future, cache_key)
+        if self._wake_w is not None:
+            # Event-driven wakeup: sub-ms instead of 50ms polling
+            wake_w = self._wake_w
+            future.add_done_callback(lambda f: os.write(wake_w, b'\0'))
+        else:
+            self.root.after(50, self._poll_future, future, cache_key)
+
+    def _analyze_and_format(self, url):
+        """Worker side: run the analysis, then pre-render the result text
+
+        Building the multi-KB result strings here keeps the Tk main
+        thread down to a single cheap insert per pane.
+        """
+        analysis = self.job_hunter.analyze_job_opportunity(url)
+        if not analysis:
+            return None
+        return analysis, self._format_results(analysis)
+
+    def _poll_future(self, future, cache_key):
+        """Check the in-flight analysis; reschedule until it finishes"""
+        if self._pending is None or future is not self._current_future:
+            return  # superseded by a newer URL, or already consumed
+        if not future.done():
+            # A stale pipe wake can land here while the new future is
+            # still running; only the Windows path polls, the wake-pipe
+            # path gets re-entered by the done callback
+            if self._wake_w is None:
+                self.root.after(50, self._poll_future, future, cache_key)
+            return
+
+        self._pending = None
+        self._current_future = None
+        try:
+            result = future.result()
+        except Exception as e:
+            self.show_error(f"Analysis failed: {str(e)}")
+            return
+
+        if result:
+            analysis, formatted = result
+            self._store_analysis(cache_key, analysis)
+            self.display_results(analysis, formatted)
+        else:
+            self.show_error("Could not analyze job")
+
+    def _cache_file_for(self, cache_key):
+        """Disk cache path for a normalized URL"""
+        return CACHE_DIR / (hashlib.sha1(cache_key.encode()).hexdigest() + '.json')
+
+    def _cached_analysis(self, cache_key):
+        """Look up an analysis in memory, then on disk; None on miss"""
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            return cached
+
+        # Probe the file before touching the engine: on the common first
+        # click both caches are empty, and _load_ai_engine would block
+        # the Tk thread behind the multi-second import the background
+        # prewarm may still be holding the lock for
+        cache_file = self._cache_file_for(cache_key)
+        if not cache_file.exists():
+            return None
+
+        _load_ai_engine()  # disk entries rebuild into JobAnalysis
+        if JobAnalysis is None:
+            return None
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = JobAnalysis(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        self._analysis_cache[cache_key] = cached
+        return cached
+
+    def _store_analysis(self, cache_key, analysis):
+        """Remember an analysis in the LRU and persist it under saves/"""
+        self._analysis_cache[cache_key] = analysis
+        self._analysis_cache.move_to_end(cache_key)
+        while len(self._analysis_cache) > CACHE_LIMIT:
+            self._analysis_cache.popitem(last=False)
+
+        try:
+            with open(self._cache_file_for(cache_key), 'w', encoding='utf-8') as f:
+                json.dump(asdict(analysis), f)
+        except (OSError, TypeError):
+            pass  # cache persistence is best effort
+
     def show_error(self, message):
         """Show error message safely"""
+        self.analyze_btn.state(['!disabled'])
         messagebox.showerror("Error", message)
     
     def show_demo_analysis(self, url):
         """Show demo analysis for testing"""
-        import random
-        
-        # Parse basic info from URL
-        company = "Demo Company"
-        job_title = "Software Engineer"
-        
-        if "linkedin" in url.lower():
-            company = "LinkedIn Company"
-        elif "indeed" in url.lower():
-            company = "Indeed Company"
-        elif "google" in url.lower():
-            company = "Google"
-            job_title = "Senior Software Engineer"
-        
+        # Parse basic info from URL - one lowercase pass, table lookup
+        url_lc = url.lower()
+        company, job_title = next(
+            (pair for token, pair in self._DEMO_MAP.items() if token in url_lc),
+            ("Demo Company", "Software Engineer"))
+
         # Mock job details
         job_details = f"""Job Title: {job_title}
 Company: {company}
@@ -181,12 +454,11 @@ Key Requirements:
 • Experience with cloud platforms (AWS/GCP/Azure)
 • Knowledge of modern web frameworks
 • Bachelor's degree in Computer Science or related field"""
-        
-        self.job_info.delete(1.0, tk.END)
-        self.job_info.insert(1.0, job_details)
-        
-        # Mock AI analysis
-        match_score = random.randint(75, 95)
+
+        # Mock AI analysis - deterministic per URL so a repeat lookup of
+        # the same posting shows the same score (str hash() is salted
+        # per process, hence the digest)
+        match_score = 75 + int.from_bytes(hashlib.sha1(url.encode()).digest()[:4], 'big') % 21
         ai_analysis = f"""MATCH SCORE: {match_score}/100
 
 SKILL ANALYSIS:
@@ -209,19 +481,48 @@ AREAS TO IMPROVE:
 • Research the company's recent product launches
 • Prepare examples of scalable solutions you've built
 • Review AWS fundamentals for technical interviews"""
-        
-        self.analysis_info.delete(1.0, tk.END)
-        self.analysis_info.insert(1.0, ai_analysis)
-        
+
+        self._blit(job_details, ai_analysis)
+        self.analyze_btn.state(['!disabled'])
+
         messagebox.showinfo("Analysis Complete", f"Job analysis complete!\nMatch Score: {match_score}/100\n\n(Demo Mode - Mock Analysis)")
     
-    def display_results(self, analysis):
-        """Display analysis results"""
-        # Store analysis for data passing to other tools
-        self.current_analysis = analysis
-        
-        # Job details
-        self.job_info.delete(1.0, tk.END)
+    def _write(self, widget, text):
+        """One delete+insert, toggling editability around it
+
+        Keeping the widgets disabled between fills prevents stray user
+        edits; undo is off entirely (see create_interface) so Tk never
+        builds a giant undo record for the multi-KB fills.
+        """
+        widget.config(state='normal')
+        widget.delete('1.0', 'end')
+        widget.insert('1.0', text)
+        widget.config(state='disabled')
+
+    def _emit(self, widget, segments):
+        """Fill a pane from (text, tag) segments with one state toggle"""
+        widget.config(state='normal')
+        widget.delete('1.0', 'end')
+        for text, tag in segments:
+            if tag:
+                widget.insert('end', text, tag)
+            else:
+                widget.insert('end', text)
+        widget.config(state='disabled')
+
+    def _blit(self, job_text, ai_output):
+        """Fill both result panes; the AI pane takes a string or segments"""
+        self._write(self.job_info, job_text)
+        if isinstance(ai_output, str):
+            self._write(self.analysis_info, ai_output)
+        else:
+            self._emit(self.analysis_info, ai_output)
+
+    def _format_results(self, analysis):
+        """Build the two result strings - pure CPU, no Tk calls"""
+        requirements = _bullets(analysis.requirements)
+        qualifications = _bullets(analysis.preferred_qualifications, 8)
+
         job_details = f"""🎯 JOB OVERVIEW
 Job Title: {analysis.title}
 Company: {analysis.company}
@@ -235,76 +536,102 @@ Company Size: {analysis.company_size.replace('_', ' ').title()}
 {analysis.description}
 
 🔧 REQUIRED SKILLS:
-{chr(10).join([f"• {req}" for req in analysis.requirements[:10]])}
+{requirements}
 
 ⭐ PREFERRED QUALIFICATIONS:
-{chr(10).join([f"• {qual}" for qual in analysis.preferred_qualifications[:8]])}"""
-        
-        self.job_info.insert(1.0, job_details)
-        
-        # Enhanced AI analysis
-        self.analysis_info.delete(1.0, tk.END)
-        overall_score = int(analysis.overall_rating)
-        
+{qualifications}"""
+
         # Get company intelligence data
         company_intel_text = self.get_company_intelligence(analysis)
-        
-        ai_analysis = f"""🎯 OVERALL RATING: {overall_score}/100
 
-📊 DETAILED SCORES:
-• Skill Match: {int(analysis.skill_match_score)}/100
-• Culture Fit: {int(analysis.culture_fit_score)}/100  
-• Growth Potential: {int(analysis.growth_potential_score)}/100
-• Success Probability: {int(analysis.success_probability)}/100
+        advantages = (_bullets(analysis.competitive_advantages, None)
+                      if analysis.competitive_advantages
+                      else BULLET + "No specific advantages identified")
+        skill_gaps = (_bullets(analysis.required_skills_missing, None)
+                      if analysis.required_skills_missing
+                      else BULLET + "No critical skill gaps identified based on current profile")
 
-{company_intel_text}
+        # The AI pane is built as (text, tag) segments: headers and score
+        # colours are pre-tagged so Tk styles them during the insert
+        overall_score = int(analysis.overall_rating)
+        ai_segments = [
+            ("🎯 OVERALL RATING: ", 'header'),
+            (f"{overall_score}/100\n\n", _score_tag(overall_score)),
+            ("📊 DETAILED SCORES:\n", 'header'),
+            (f"• Skill Match: {int(analysis.skill_match_score)}/100\n"
+             f"• Culture Fit: {int(analysis.culture_fit_score)}/100\n"
+             f"• Growth Potential: {int(analysis.growth_potential_score)}/100\n"
+             f"• Success Probability: {int(analysis.success_probability)}/100\n\n", None),
+            (company_intel_text + "\n\n", None),
+            ("🚀 COMPETITIVE ADVANTAGES:\n", 'header'),
+            (advantages + "\n\n", None),
+            ("📚 SKILL GAPS TO ADDRESS:\n", 'header'),
+            (skill_gaps + "\n\n", None),
+            ("💡 APPLICATION STRATEGY:\n", 'header'),
+            (analysis.application_strategy + "\n\n", None),
+            ("⏰ TIMING & FOLLOW-UP:\n", 'header'),
+            (f"• Optimal Timing: {analysis.optimal_timing.replace('_', ' ').title()}\n"
+             f"• Follow-up Strategy: {analysis.follow_up_strategy}", None),
+        ]
 
-🚀 COMPETITIVE ADVANTAGES:
-{chr(10).join([f"• {adv}" for adv in analysis.competitive_advantages]) if analysis.competitive_advantages else "• No specific advantages identified"}
+        return job_details, ai_segments
 
-📚 SKILL GAPS TO ADDRESS:
-{chr(10).join([f"• {skill}" for skill in analysis.required_skills_missing]) if analysis.required_skills_missing else "• No critical skill gaps identified based on current profile"}
+    def display_results(self, analysis, formatted=None):
+        """Display analysis results"""
+        # Store analysis for data passing to other tools
+        self.current_analysis = analysis
 
-💡 APPLICATION STRATEGY:
-{analysis.application_strategy}
+        # Cache hits arrive unformatted; worker results come pre-rendered
+        if formatted is None:
+            formatted = self._format_results(analysis)
+        self._blit(*formatted)
+        self.analyze_btn.state(['!disabled'])
 
-⏰ TIMING & FOLLOW-UP:
-• Optimal Timing: {analysis.optimal_timing.replace('_', ' ').title()}
-• Follow-up Strategy: {analysis.follow_up_strategy}"""
-        
-        self.analysis_info.insert(1.0, ai_analysis)
-        
-        messagebox.showinfo("Analysis Complete", f"Job analysis complete!\nOverall Rating: {overall_score}/100")
+        messagebox.showinfo("Analysis Complete", f"Job analysis complete!\nOverall Rating: {int(analysis.overall_rating)}/100")
     
     def get_company_intelligence(self, analysis):
         """Get company intelligence information"""
-        # Try to get more detailed company info from the AI system
         try:
-            company_info = f"""🏢 COMPANY INTELLIGENCE:
-• Industry: {analysis.industry.title()}
-• Company Size: {analysis.company_size.replace('_', ' ').title()}
-• Work Environment: {analysis.job_type.title()} position
-• Growth Stage: Established (based on job posting analysis)"""
-            
-            # Add culture insights if available
-            if hasattr(analysis, 'culture_insights'):
-                company_info += f"\n• Culture Insights: {analysis.culture_insights}"
-                
-            return company_info
-        except:
+            return _company_intel(analysis.industry, analysis.company_size,
+                                  analysis.job_type,
+                                  getattr(analysis, 'culture_insights', None) or "")
+        except AttributeError:  # e.g. company_size is None
             return """🏢 COMPANY INTELLIGENCE:
 • Basic company information extracted from job posting
 • Full company analysis available in advanced mode"""
     
+    def _launch(self, module_path, class_name, **kwargs):
+        """Launch a sibling GUI in-process inside a Toplevel window
+
+        Skips the 200-800ms interpreter cold start of a subprocess launch
+        and shares already-warm imports (tkinter, requests session, AI
+        engine). Modules are loaded once and cached for repeat clicks.
+        """
+        module = self._loaded_modules.get(module_path)
+        if module is None:
+            import importlib.util
+            module_name = os.path.splitext(os.path.basename(module_path))[0].replace('-', '_')
+            spec = importlib.util.spec_from_file_location(module_name, module_path)
+            if spec is None:
+                raise ImportError(f"Cannot load {module_path}")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._loaded_modules[module_path] = module
+
+        gui_class = getattr(module, class_name)
+        return gui_class(master=tk.Toplevel(self.root), **kwargs)
+
     def generate_application(self):
         """Generate application materials"""
         try:
-            # Try to launch AI Commander
-            import subprocess
-            subprocess.Popen([
-                'python', 
-                os.path.join(os.path.dirname(os.path.dirname(__file__)), 'gui', 'ai_commander_gui.py')
-            ])
+            self._launch(COMMANDER_GUI, 'AICommanderGUI')
+            messagebox.showinfo("Launching", "AI Commander launched for application generation!")
+            return
+        except Exception:
+            pass  # fall back to a separate process
+
+        try:
+            subprocess.Popen(['python', str(COMMANDER_GUI)])
             messagebox.showinfo("Launching", "AI Commander launched for application generation!")
         except Exception as e:
             messagebox.showinfo("Generate Application", 
@@ -319,11 +646,7 @@ Company Size: {analysis.company_size.replace('_', ' ').title()}
         """Launch interview practice with job data"""
         try:
             # Check if we have analysis data to pass
-            if hasattr(self, 'current_analysis') and self.current_analysis:
-                # Create a data file to pass job info to interview prep
-                import tempfile
-                import json
-                
+            if self.current_analysis is not None:
                 job_data = {
                     'company': self.current_analysis.company,
                     'job_title': self.current_analysis.title,
@@ -335,35 +658,40 @@ Company Size: {analysis.company_size.replace('_', ' ').title()}
                     'skill_gaps': self.current_analysis.required_skills_missing,
                     'competitive_advantages': self.current_analysis.competitive_advantages
                 }
-                
-                # Save to temp file
-                temp_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'temp')
-                os.makedirs(temp_dir, exist_ok=True)
-                data_file = os.path.join(temp_dir, 'current_job_analysis.json')
-                
-                with open(data_file, 'w') as f:
-                    json.dump(job_data, f, indent=2)
-                
-                # Launch interview prep
-                interview_gui_path = os.path.join(
-                    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                    '07-INTERVIEW-PREP-AI', 'gui', 'simple-interview-gui.py'
-                )
-                subprocess.Popen(['python', interview_gui_path])
-                messagebox.showinfo("Launching Interview Practice", 
+
+                try:
+                    # In-process launch hands the data straight to the
+                    # constructor - no temp-file round trip
+                    self._launch(INTERVIEW_GUI, 'SimpleInterviewGUI', job_data=job_data)
+                except Exception:
+                    # Subprocess fallback: the interview tool only knows
+                    # the legacy fixed path and takes no arguments, so
+                    # the hand-off must go through temp/current_job_analysis.json
+                    if orjson is not None:
+                        payload = orjson.dumps(job_data)
+                    else:
+                        payload = json.dumps(job_data, separators=(',', ':')).encode()
+
+                    temp_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'temp')
+                    os.makedirs(temp_dir, exist_ok=True)
+                    with open(os.path.join(temp_dir, 'current_job_analysis.json'), 'wb') as f:
+                        f.write(payload)
+
+                    subprocess.Popen(['python', str(INTERVIEW_GUI)])
+
+                messagebox.showinfo("Launching Interview Practice",
                                    f"Interview Practice launched with job data!\n\n" +
                                    f"Company: {self.current_analysis.company}\n" +
                                    f"Role: {self.current_analysis.title}\n\n" +
                                    "Job-specific questions will be generated automatically.")
             else:
                 # Launch without data
-                interview_gui_path = os.path.join(
-                    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                    '07-INTERVIEW-PREP-AI', 'gui', 'simple-interview-gui.py'
-                )
-                subprocess.Popen(['python', interview_gui_path])
+                try:
+                    self._launch(INTERVIEW_GUI, 'SimpleInterviewGUI')
+                except Exception:
+                    subprocess.Popen(['python', str(INTERVIEW_GUI)])
                 messagebox.showinfo("Launching", "Interview Practice launched!\n\n(Analyze a job first to get custom questions)")
-                
+
         except Exception as e:
             messagebox.showinfo("Practice Interview", 
                                "Interview practice ready!\n\n" +
@@ -376,12 +704,14 @@ Company Size: {analysis.company_size.replace('_', ' ').title()}
     def find_learning(self):
         """Find learning resources"""
         try:
-            # Try to launch Learning Coach
-            learning_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                '06-LEARNING-COACH', 'gui', 'learning_coach_gui.py'
-            )
-            subprocess.Popen(['python', learning_path])
+            self._launch(LEARNING_GUI, 'LearningCoachGUI')
+            messagebox.showinfo("Launching", "Learning Coach launched!")
+            return
+        except Exception:
+            pass  # fall back to a separate process
+
+        try:
+            subprocess.Popen(['python', str(LEARNING_GUI)])
             messagebox.showinfo("Launching", "Learning Coach launched!")
         except Exception as e:
             messagebox.showinfo("Find Learning", 
@@ -395,31 +725,28 @@ Company Size: {analysis.company_size.replace('_', ' ').title()}
     def save_analysis(self):
         """Save analysis results"""
         try:
-            # Create saves directory
-            saves_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'saves')
-            os.makedirs(saves_dir, exist_ok=True)
-            
             # Get current analysis
             job_content = self.job_info.get(1.0, tk.END).strip()
             analysis_content = self.analysis_info.get(1.0, tk.END).strip()
             
             if job_content and analysis_content and "Job Title:" in job_content:
-                # Generate filename from timestamp
-                import datetime
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"job_analysis_{timestamp}.txt"
-                filepath = os.path.join(saves_dir, filename)
-                
-                # Save analysis
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write("=== JOB ANALYSIS REPORT ===\n\n")
-                    f.write("JOB DETAILS:\n")
-                    f.write(job_content)
-                    f.write("\n\n" + "="*50 + "\n\n")
-                    f.write("AI ANALYSIS:\n")
-                    f.write(analysis_content)
-                    f.write(f"\n\n--- Saved on {datetime.datetime.now().strftime('%Y-%m-%d at %H:%M:%S')} ---")
-                
+                # One now() serves both the filename and the footer
+                now = datetime.datetime.now()
+                filepath = SAVES_DIR / f"job_analysis_{now:%Y%m%d_%H%M%S}.txt"
+
+                # Save analysis - one buffered writelines instead of
+                # seven separate write calls
+                with open(filepath, 'w', encoding='utf-8', buffering=65536, newline='\n') as f:
+                    f.writelines([
+                        "=== JOB ANALYSIS REPORT ===\n\n",
+                        "JOB DETAILS:\n",
+                        job_content,
+                        "\n\n" + "=" * 50 + "\n\n",
+                        "AI ANALYSIS:\n",
+                        analysis_content,
+                        f"\n\n--- Saved on {now:%Y-%m-%d at %H:%M:%S} ---",
+                    ])
+
                 messagebox.showinfo("Saved", f"Job analysis saved!\n\nLocation: {filepath}")
             else:
                 messagebox.showwarning("Nothing to Save", "Please analyze a job first before saving.")
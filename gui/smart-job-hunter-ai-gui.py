@@ -1,13 +1,23 @@
 # -*- coding: utf-8 -*-
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
+from tkinter import font as tkfont
 import sys
 import os
+from collections import OrderedDict, deque
+import csv
 from datetime import datetime
+import dataclasses
+import functools
+import hashlib
 import json
+import sqlite3
 import webbrowser
+from operator import itemgetter
 from typing import Dict, List, Optional
 import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
@@ -17,7 +27,169 @@ except ImportError as e:
     print(f"Warning: Could not import Smart Job Hunter AI: {e}")
     SmartJobHunterAI = None
 
+# On-disk mirror of the analysis cache so repeat lookups survive restarts
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.sjh_cache.json')
+
+# Keep only this many lines in the integration activity log; the trim
+# waits for this much overshoot so deletes happen in rare batches
+LOG_MAX_LINES = 2000
+LOG_TRIM_SLACK = 500
+
+# Shared render fragments - constant lookups beat chr(10) calls and
+# repeated literal allocation in the hot render paths
+_NL = "\n"
+_BULLET = "• "
+
+# Dark theme palette - module-level so it is built once, not per call
+COLORS = {
+    'bg': '#1e1e1e',
+    'fg': '#ffffff',
+    'select_bg': '#0078d4',
+    'select_fg': '#ffffff',
+    'entry_bg': '#2d2d2d',
+    'button_bg': '#0078d4',
+    'button_fg': '#ffffff',
+    'frame_bg': '#2d2d2d',
+    'success': '#00ff88',
+    'warning': '#ffaa00',
+    'error': '#ff4444'
+}
+
+# LRU cap for memoized engine calls - bounds memory on long sessions
+CALL_CACHE_LIMIT = 512
+
+# Job history lives in SQLite; only the newest window is held in memory
+HISTORY_DB = os.path.join(os.path.expanduser('~'), '.sjh_history.db')
+HISTORY_WINDOW = 500
+
+# At most this many history rows live in the Treeview at once; scrolling
+# pages the window through the backing list
+HISTORY_PAGE = 200
+
+@functools.lru_cache(maxsize=256)
+def _bulletize(items):
+    """Join a tuple of strings into a bullet list, memoized per tuple.
+
+    Re-rendering the same analysis (history double-clicks, repeat
+    displays) hits the cache instead of rebuilding each block.
+    """
+    return _NL.join(_BULLET + item for item in items)
+
+def _engine_worker(req_q, resp_q):
+    """Entry point for the engine worker process.
+
+    Hosts SmartJobHunterAI in its own process so the engine's heavy
+    imports stay out of the GUI's memory footprint and a scraper crash
+    cannot take the window down. Requests are (req_id, method, args)
+    tuples; None shuts the worker down.
+    """
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+    from smart_job_hunter_ai import SmartJobHunterAI as Engine
+    engine = Engine()
+    while True:
+        request = req_q.get()
+        if request is None:
+            break
+        req_id, method, args = request
+        try:
+            resp_q.put((req_id, True, getattr(engine, method)(*args)))
+        except Exception as e:
+            resp_q.put((req_id, False, str(e)))
+
 class SmartJobHunterGUI:
+
+    # The four strategy documents are mostly static text; pre-built
+    # format templates mean each generation only substitutes the few
+    # job-specific fields instead of re-tokenizing giant f-strings
+    _COVER_LETTER_TMPL = """Dear Hiring Manager,
+
+I am writing to express my strong interest in the {title} position at {company}. With my background in software development and AI systems, I am excited about the opportunity to contribute to your team.
+
+Based on my analysis of the role, I have identified several key areas where my experience aligns perfectly with your requirements:
+
+{skills_block}
+
+I am particularly drawn to {company} because of your innovative approach to technology and commitment to excellence. I believe my passion for AI and automation makes me an ideal candidate for this role.
+
+I would welcome the opportunity to discuss how my skills and experience can contribute to your team's success.
+
+Best regards,
+[Your Name]"""
+
+    _RESUME_TMPL = """Resume Optimization Recommendations for {title}:
+
+1. HIGHLIGHT THESE SKILLS:
+{highlight_block}
+
+2. EXPERIENCE ALIGNMENT:
+   • Emphasize projects that demonstrate {first_skill} experience
+   • Quantify achievements with metrics and results
+   • Include relevant technologies: {pref5}
+
+3. KEYWORDS TO INCLUDE:
+   {keywords}
+
+4. RECOMMENDED SECTIONS:
+   • Technical Skills (prominently featured)
+   • Relevant Projects
+   • Professional Experience
+   • Certifications
+   • Education
+
+5. TAILORING SUGGESTIONS:
+   • Customize project descriptions to match job requirements
+   • Use industry-specific terminology
+   • Highlight leadership and collaboration experiences"""
+
+    _INTERVIEW_TMPL = """Interview Preparation for {title}:
+
+TECHNICAL QUESTIONS TO EXPECT:
+{question_block}
+
+BEHAVIORAL QUESTIONS:
+• Tell me about a challenging project you've worked on
+• How do you handle competing priorities?
+• Describe a time you had to learn a new technology quickly
+• How do you collaborate with cross-functional teams?
+
+QUESTIONS TO ASK THEM:
+• What are the biggest technical challenges the team is facing?
+• How does the team approach professional development?
+• What does success look like in this role after 6 months?
+• Can you tell me about the team culture and collaboration style?
+
+PREPARATION TASKS:
+• Research {company}'s recent projects and news
+• Prepare specific examples that demonstrate required skills
+• Review fundamentals of key technologies
+• Practice explaining complex technical concepts simply"""
+
+    _FOLLOWUP_TMPL = """Follow-up Strategy for {company}:
+
+TIMELINE:
+Day 1: Submit application
+Day 2-3: Connect with hiring manager on LinkedIn
+Day 7: Follow-up email if no response
+Day 14: Second follow-up with additional value
+
+FOLLOW-UP MESSAGES:
+1. Thank you note after application
+2. LinkedIn connection request with personalized note
+3. Value-added follow-up (relevant article, insight, or project)
+4. Final gentle reminder before moving on
+
+NETWORKING APPROACH:
+• Connect with current employees in similar roles
+• Engage with company content on social media
+• Attend company events or webinars if available
+• Look for warm introductions through mutual connections
+
+TRACKING:
+• Application submission date
+• Response dates and next steps
+• Interview dates and feedback
+• Final decision and lessons learned"""
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Smart Job Hunter AI - Professional Edition")
@@ -27,10 +199,74 @@ class SmartJobHunterGUI:
         # Enhanced styling
         self.setup_styles()
         
-        # Initialize AI system
-        self.job_hunter = SmartJobHunterAI() if SmartJobHunterAI else None
+        # Initialize AI system. The engine normally runs in a separate
+        # worker process (see _engine_call); this in-process instance is
+        # only created as a fallback when multiprocessing is unavailable
+        self.job_hunter = None
+        self._worker = None
+        self._req_q = None
+        self._resp_q = None
+        self._req_seq = 0
+        self._worker_results = {}
+        self._worker_lock = threading.Lock()
         self.current_analysis = None
-        self.job_history = []
+        # Bounded: full analyses live in SQLite, so the in-memory list only
+        # needs the newest window of display rows
+        self.job_history = deque(maxlen=HISTORY_WINDOW)
+
+        # Treeview rows currently in the history table, keyed by entry id -
+        # refreshes diff against this instead of rebuilding every row
+        self._history_items = {}
+        # Entry id -> job dict, so row activations resolve in O(1) instead
+        # of scanning the history list
+        self._history_by_id = {}
+        self._history_seq = 0
+        self._session_tag = datetime.now().strftime('%Y%m%d%H%M%S%f')
+
+        # Sorted view of job_history plus the slice currently in the tree
+        self._display_jobs = []
+        self._win_start = 0
+
+        # History is persisted to SQLite; full analysis payloads stay on
+        # disk and are only deserialized when a row is actually opened
+        self._history_db = sqlite3.connect(HISTORY_DB)
+        self._history_db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, date TEXT, company TEXT, position TEXT, "
+            "status TEXT, score REAL, payload TEXT)")
+        self._history_db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_date ON jobs(date)")
+        self._history_db.commit()
+
+        # Completed analyses keyed by sha1(url + analysis depth) - repeat
+        # clicks on the same posting skip the network/LLM round-trip
+        self._analysis_cache = {}
+
+        # Bounded worker pool shared by every background call; repeated
+        # clicks reuse the in-flight future instead of spawning new threads
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sjh")
+        self._inflight = {}
+
+        # LRU-memoized engine call results keyed by method + arguments, so
+        # e.g. researching the same company across several jobs pays once
+        self._call_cache = OrderedDict()
+
+        # Pending after() timers for debounced event handlers, keyed by name
+        self._timers = {}
+
+        # Log lines recorded before the Integration Hub tab is first built
+        self._pending_log = []
+
+        # Buffered log appends, flushed once per 50 ms tick
+        self._log_buffer = []
+        self._log_flush_id = None
+
+        # Settings variables live here (not in the tab builders) so the
+        # rest of the app can read them before their tab is ever opened
+        self.model_var = tk.StringVar(value="gpt-3.5-turbo")
+        self.depth_var = tk.StringVar(value="Standard")
+        self.auto_save_var = tk.BooleanVar(value=True)
+        self.auto_integrate_var = tk.BooleanVar(value=False)
         
         # Create main interface
         self.create_main_interface()
@@ -40,24 +276,23 @@ class SmartJobHunterGUI:
     
     def setup_styles(self):
         """Configure modern dark theme styles"""
+        # Re-theme/DPI callbacks can re-enter here; the work is identical
+        # every time, so do it once and bail out after that
+        if getattr(self, '_styles_applied', False):
+            return
+        self._styles_applied = True
+
         style = ttk.Style()
         style.theme_use('clam')
-        
-        # Configure dark theme colors
-        colors = {
-            'bg': '#1e1e1e',
-            'fg': '#ffffff',
-            'select_bg': '#0078d4',
-            'select_fg': '#ffffff',
-            'entry_bg': '#2d2d2d',
-            'button_bg': '#0078d4',
-            'button_fg': '#ffffff',
-            'frame_bg': '#2d2d2d',
-            'success': '#00ff88',
-            'warning': '#ffaa00',
-            'error': '#ff4444'
-        }
-        
+
+        # One shared Font object per family/size - Tk caches the metrics
+        # once instead of re-parsing a tuple per widget and per draw
+        self.mono_font = tkfont.Font(family='Consolas', size=9)
+        self.ui_font = tkfont.Font(family='Segoe UI', size=10)
+        self.mono_linespace = self.mono_font.metrics('linespace')
+
+        colors = COLORS
+
         # Apply styles
         style.configure('TNotebook', background=colors['bg'], borderwidth=0)
         style.configure('TNotebook.Tab', background=colors['frame_bg'], foreground=colors['fg'], 
@@ -65,7 +300,7 @@ class SmartJobHunterGUI:
         style.map('TNotebook.Tab', background=[('selected', colors['select_bg'])])
         
         style.configure('TFrame', background=colors['bg'])
-        style.configure('TLabel', background=colors['bg'], foreground=colors['fg'], font=('Segoe UI', 10))
+        style.configure('TLabel', background=colors['bg'], foreground=colors['fg'], font=self.ui_font)
         style.configure('TButton', background=colors['button_bg'], foreground=colors['button_fg'],
                        font=('Segoe UI', 10, 'bold'), padding=[15, 8])
         style.configure('TEntry', fieldbackground=colors['entry_bg'], foreground=colors['fg'],
@@ -76,6 +311,12 @@ class SmartJobHunterGUI:
         style.configure('Success.TLabel', foreground=colors['success'], font=('Segoe UI', 10, 'bold'))
         style.configure('Warning.TLabel', foreground=colors['warning'], font=('Segoe UI', 10, 'bold'))
         style.configure('Error.TLabel', foreground=colors['error'], font=('Segoe UI', 10, 'bold'))
+
+        # Resource-database defaults: classic widgets (the ScrolledText
+        # panes especially) pick these up at creation from the option DB
+        # instead of each constructor passing and re-resolving a font kwarg
+        self.root.option_add('*Font', self.ui_font)
+        self.root.option_add('*Text.font', self.ui_font)
     
     def create_main_interface(self):
         """Create the main tabbed interface"""
@@ -98,21 +339,43 @@ class SmartJobHunterGUI:
         # Create notebook for tabs
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill='both', expand=True)
-        
-        # Create all tabs
-        self.create_job_analysis_tab()
-        self.create_company_intelligence_tab()
-        self.create_application_strategy_tab()
-        self.create_success_prediction_tab()
-        self.create_integration_hub_tab()
-        self.create_job_history_tab()
-        self.create_settings_tab()
-    
-    def create_job_analysis_tab(self):
+
+        # Register all tabs as empty placeholder frames and only build the
+        # one the user actually selects - each tab holds dozens of widgets
+        # and widget creation is the slowest part of startup
+        self._tab_builders = {
+            "Job Analysis": self.create_job_analysis_tab,
+            "Company Intelligence": self.create_company_intelligence_tab,
+            "Application Strategy": self.create_application_strategy_tab,
+            "Success Prediction": self.create_success_prediction_tab,
+            "Integration Hub": self.create_integration_hub_tab,
+            "Job History": self.create_job_history_tab,
+            "Settings": self.create_settings_tab,
+        }
+        self._tab_frames = {}
+        self._built = set()
+        for name in self._tab_builders:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=name)
+            self._tab_frames[name] = frame
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        # The first tab is visible immediately, so build it up front
+        self._build_tab("Job Analysis")
+
+    def _build_tab(self, name):
+        """Build a tab's widgets on first use"""
+        if name in self._built:
+            return
+        self._built.add(name)
+        self._tab_builders[name](self._tab_frames[name])
+
+    def _on_tab_changed(self, event):
+        """Materialize the newly selected tab if it is still a placeholder"""
+        self._build_tab(self.notebook.tab(self.notebook.select(), 'text'))
+
+    def create_job_analysis_tab(self, tab):
         """Create job analysis and scraping tab"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Job Analysis")
-        
         # Job URL input section
         input_frame = ttk.Frame(tab)
         input_frame.pack(fill='x', padx=20, pady=20)
@@ -124,9 +387,12 @@ class SmartJobHunterGUI:
         
         self.job_url_entry = ttk.Entry(url_frame, font=('Segoe UI', 11))
         self.job_url_entry.pack(side='left', fill='x', expand=True, padx=(0, 10))
-        
-        analyze_btn = ttk.Button(url_frame, text="Analyze Job", command=self.analyze_job)
-        analyze_btn.pack(side='right')
+        # Debounced so a burst of keystrokes/pastes runs the handler once
+        self.job_url_entry.bind('<KeyRelease>',
+                                lambda e: self._debounce('url', self._validate_url))
+
+        self.analyze_btn = ttk.Button(url_frame, text="Analyze Job", command=self.analyze_job)
+        self.analyze_btn.pack(side='right')
         
         # Quick actions
         quick_frame = ttk.Frame(input_frame)
@@ -156,7 +422,7 @@ class SmartJobHunterGUI:
         
         ttk.Label(left_frame, text="Job Details:", font=('Segoe UI', 11, 'bold')).pack(anchor='w')
         self.job_details_text = scrolledtext.ScrolledText(left_frame, height=15, wrap='word',
-                                                         font=('Consolas', 9))
+                                                         font=self.mono_font)
         self.job_details_text.pack(fill='both', expand=True, pady=(5, 0))
         
         # Right panel - AI Analysis
@@ -165,7 +431,7 @@ class SmartJobHunterGUI:
         
         ttk.Label(right_frame, text="AI Analysis:", font=('Segoe UI', 11, 'bold')).pack(anchor='w')
         self.ai_analysis_text = scrolledtext.ScrolledText(right_frame, height=15, wrap='word',
-                                                         font=('Consolas', 9))
+                                                         font=self.mono_font)
         self.ai_analysis_text.pack(fill='both', expand=True, pady=(5, 0))
         
         # Analysis actions
@@ -179,11 +445,8 @@ class SmartJobHunterGUI:
         ttk.Button(actions_frame, text="Send to Learning Coach", 
                   command=self.send_to_learning_coach).pack(side='left')
     
-    def create_company_intelligence_tab(self):
+    def create_company_intelligence_tab(self, tab):
         """Create company research and intelligence tab"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Company Intelligence")
-        
         # Company search section
         search_frame = ttk.Frame(tab)
         search_frame.pack(fill='x', padx=20, pady=20)
@@ -196,9 +459,9 @@ class SmartJobHunterGUI:
         self.company_entry = ttk.Entry(company_frame, font=('Segoe UI', 11))
         self.company_entry.pack(side='left', fill='x', expand=True, padx=(0, 10))
         
-        research_btn = ttk.Button(company_frame, text="Research Company", 
-                                 command=self.research_company)
-        research_btn.pack(side='right')
+        self.research_btn = ttk.Button(company_frame, text="Research Company",
+                                      command=self.research_company)
+        self.research_btn.pack(side='right')
         
         # Intelligence dashboard
         dashboard_frame = ttk.Frame(tab)
@@ -211,36 +474,29 @@ class SmartJobHunterGUI:
         # Company overview tab
         overview_tab = ttk.Frame(intel_notebook)
         intel_notebook.add(overview_tab, text="Overview")
-        self.company_overview_text = scrolledtext.ScrolledText(overview_tab, wrap='word',
-                                                              font=('Segoe UI', 10))
+        self.company_overview_text = scrolledtext.ScrolledText(overview_tab, wrap='word')
         self.company_overview_text.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Culture analysis tab
         culture_tab = ttk.Frame(intel_notebook)
         intel_notebook.add(culture_tab, text="Culture Analysis")
-        self.culture_analysis_text = scrolledtext.ScrolledText(culture_tab, wrap='word',
-                                                              font=('Segoe UI', 10))
+        self.culture_analysis_text = scrolledtext.ScrolledText(culture_tab, wrap='word')
         self.culture_analysis_text.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Financial health tab
         financial_tab = ttk.Frame(intel_notebook)
         intel_notebook.add(financial_tab, text="Financial Health")
-        self.financial_health_text = scrolledtext.ScrolledText(financial_tab, wrap='word',
-                                                              font=('Segoe UI', 10))
+        self.financial_health_text = scrolledtext.ScrolledText(financial_tab, wrap='word')
         self.financial_health_text.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Recent news tab
         news_tab = ttk.Frame(intel_notebook)
         intel_notebook.add(news_tab, text="Recent News")
-        self.company_news_text = scrolledtext.ScrolledText(news_tab, wrap='word',
-                                                          font=('Segoe UI', 10))
+        self.company_news_text = scrolledtext.ScrolledText(news_tab, wrap='word')
         self.company_news_text.pack(fill='both', expand=True, padx=10, pady=10)
     
-    def create_application_strategy_tab(self):
+    def create_application_strategy_tab(self, tab):
         """Create application strategy and optimization tab"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Application Strategy")
-        
         # Strategy configuration
         config_frame = ttk.Frame(tab)
         config_frame.pack(fill='x', padx=20, pady=20)
@@ -292,36 +548,29 @@ class SmartJobHunterGUI:
         # Cover letter tab
         cover_tab = ttk.Frame(strategy_notebook)
         strategy_notebook.add(cover_tab, text="Cover Letter")
-        self.cover_letter_text = scrolledtext.ScrolledText(cover_tab, wrap='word',
-                                                          font=('Segoe UI', 10))
+        self.cover_letter_text = scrolledtext.ScrolledText(cover_tab, wrap='word')
         self.cover_letter_text.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Resume optimization tab
         resume_tab = ttk.Frame(strategy_notebook)
         strategy_notebook.add(resume_tab, text="Resume Optimization")
-        self.resume_opt_text = scrolledtext.ScrolledText(resume_tab, wrap='word',
-                                                        font=('Segoe UI', 10))
+        self.resume_opt_text = scrolledtext.ScrolledText(resume_tab, wrap='word')
         self.resume_opt_text.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Interview preparation tab
         interview_tab = ttk.Frame(strategy_notebook)
         strategy_notebook.add(interview_tab, text="Interview Prep")
-        self.interview_prep_text = scrolledtext.ScrolledText(interview_tab, wrap='word',
-                                                            font=('Segoe UI', 10))
+        self.interview_prep_text = scrolledtext.ScrolledText(interview_tab, wrap='word')
         self.interview_prep_text.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Follow-up strategy tab
         followup_tab = ttk.Frame(strategy_notebook)
         strategy_notebook.add(followup_tab, text="Follow-up Strategy")
-        self.followup_text = scrolledtext.ScrolledText(followup_tab, wrap='word',
-                                                      font=('Segoe UI', 10))
+        self.followup_text = scrolledtext.ScrolledText(followup_tab, wrap='word')
         self.followup_text.pack(fill='both', expand=True, padx=10, pady=10)
     
-    def create_success_prediction_tab(self):
+    def create_success_prediction_tab(self, tab):
         """Create AI success prediction and analytics tab"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Success Prediction")
-        
         # Prediction dashboard
         dashboard_frame = ttk.Frame(tab)
         dashboard_frame.pack(fill='x', padx=20, pady=20)
@@ -357,8 +606,7 @@ class SmartJobHunterGUI:
         ttk.Label(analysis_frame, text="Detailed Prediction Analysis:", 
                  font=('Segoe UI', 12, 'bold')).pack(anchor='w')
         
-        self.prediction_text = scrolledtext.ScrolledText(analysis_frame, wrap='word',
-                                                        font=('Segoe UI', 10))
+        self.prediction_text = scrolledtext.ScrolledText(analysis_frame, wrap='word')
         self.prediction_text.pack(fill='both', expand=True, pady=(5, 0))
         
         # Prediction actions
@@ -374,8 +622,14 @@ class SmartJobHunterGUI:
     
     def create_prediction_factors(self, parent):
         """Create prediction factors display"""
+        # Already built once - just re-show the existing notebook
+        if getattr(self, '_factors_nb', None) is not None:
+            self._factors_nb.pack(fill='both', expand=True)
+            return
+
         factors_notebook = ttk.Notebook(parent)
         factors_notebook.pack(fill='both', expand=True)
+        self._factors_nb = factors_notebook
         
         # Skills match tab
         skills_tab = ttk.Frame(factors_notebook)
@@ -407,11 +661,8 @@ class SmartJobHunterGUI:
         self.market_factors_text = scrolledtext.ScrolledText(market_frame, height=8, wrap='word')
         self.market_factors_text.pack(fill='both', expand=True)
     
-    def create_integration_hub_tab(self):
+    def create_integration_hub_tab(self, tab):
         """Create integration hub for other AI systems"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Integration Hub")
-        
         # Integration status
         status_frame = ttk.Frame(tab)
         status_frame.pack(fill='x', padx=20, pady=20)
@@ -491,17 +742,19 @@ class SmartJobHunterGUI:
                  font=('Segoe UI', 12, 'bold')).pack(anchor='w')
         
         self.integration_log = scrolledtext.ScrolledText(logs_frame, height=12, wrap='word',
-                                                        font=('Consolas', 9))
+                                                        font=self.mono_font)
         self.integration_log.pack(fill='both', expand=True, pady=(5, 0))
-        
+
+        # Replay anything logged before this tab was first opened
+        if self._pending_log:
+            self.integration_log.insert(tk.END, ''.join(self._pending_log))
+            self._pending_log.clear()
+
         # Add initial log entry
         self.log_integration_activity("Smart Job Hunter AI initialized and ready for integration")
     
-    def create_job_history_tab(self):
+    def create_job_history_tab(self, tab):
         """Create job history and tracking tab"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Job History")
-        
         # History controls
         controls_frame = ttk.Frame(tab)
         controls_frame.pack(fill='x', padx=20, pady=20)
@@ -536,11 +789,14 @@ class SmartJobHunterGUI:
             else:
                 self.history_tree.column(col, width=150)
         
-        # Add scrollbars
+        # Add scrollbars; vertical view changes route through _on_history_yset
+        # so scrolling can page the virtualized window
         v_scrollbar = ttk.Scrollbar(history_frame, orient='vertical', command=self.history_tree.yview)
         h_scrollbar = ttk.Scrollbar(history_frame, orient='horizontal', command=self.history_tree.xview)
-        self.history_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
+        self._history_vbar = v_scrollbar
+        self.history_tree.configure(yscrollcommand=self._on_history_yset,
+                                    xscrollcommand=h_scrollbar.set)
+
         # Pack treeview and scrollbars
         self.history_tree.pack(side='left', fill='both', expand=True)
         v_scrollbar.pack(side='right', fill='y')
@@ -556,15 +812,14 @@ class SmartJobHunterGUI:
         ttk.Label(details_frame, text="Selected Job Details:", 
                  font=('Segoe UI', 12, 'bold')).pack(anchor='w')
         
-        self.job_details_display = scrolledtext.ScrolledText(details_frame, height=8, wrap='word',
-                                                            font=('Segoe UI', 10))
+        self.job_details_display = scrolledtext.ScrolledText(details_frame, height=8, wrap='word')
         self.job_details_display.pack(fill='both', expand=True, pady=(5, 0))
+
+        # Show any analyses recorded while this tab was still a placeholder
+        self.refresh_history_display()
     
-    def create_settings_tab(self):
+    def create_settings_tab(self, tab):
         """Create settings and configuration tab"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Settings")
-        
         # API Configuration
         api_frame = ttk.LabelFrame(tab, text="API Configuration", padding=20)
         api_frame.pack(fill='x', padx=20, pady=20)
@@ -576,8 +831,7 @@ class SmartJobHunterGUI:
         
         # Model selection
         ttk.Label(api_frame, text="AI Model:").pack(anchor='w')
-        self.model_var = tk.StringVar(value="gpt-3.5-turbo")
-        model_combo = ttk.Combobox(api_frame, textvariable=self.model_var, 
+        model_combo = ttk.Combobox(api_frame, textvariable=self.model_var,
                                   values=["gpt-3.5-turbo", "gpt-4", "gpt-4-turbo"], state="readonly")
         model_combo.pack(fill='x', pady=(5, 15))
         
@@ -591,19 +845,16 @@ class SmartJobHunterGUI:
         
         # Analysis depth
         ttk.Label(analysis_frame, text="Analysis Depth:").pack(anchor='w')
-        self.depth_var = tk.StringVar(value="Standard")
         depth_combo = ttk.Combobox(analysis_frame, textvariable=self.depth_var,
                                   values=["Quick", "Standard", "Deep", "Comprehensive"], state="readonly")
         depth_combo.pack(fill='x', pady=(5, 15))
         
         # Auto-save results
-        self.auto_save_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(analysis_frame, text="Auto-save analysis results", 
+        ttk.Checkbutton(analysis_frame, text="Auto-save analysis results",
                        variable=self.auto_save_var).pack(anchor='w', pady=(0, 10))
         
         # Auto-send to integrations
-        self.auto_integrate_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(analysis_frame, text="Auto-send to integrated systems", 
+        ttk.Checkbutton(analysis_frame, text="Auto-send to integrated systems",
                        variable=self.auto_integrate_var).pack(anchor='w', pady=(0, 15))
         
         # Save analysis settings
@@ -627,9 +878,109 @@ class SmartJobHunterGUI:
                   command=self.reset_settings).pack(side='left')
     
     # Core functionality methods
+    def _ensure_worker(self):
+        """Start (or restart) the engine worker process; False on failure"""
+        if self._worker is not None and self._worker.is_alive():
+            return True
+        # Wake anything still waiting on the dead worker with an error -
+        # those requests sit in the abandoned queue and would otherwise
+        # wait forever once a new worker replaces self._worker
+        for req_id in list(self._worker_results):
+            entry = self._worker_results.pop(req_id, None)
+            if entry is not None:
+                entry[1] = (False, "Analysis worker died - please retry")
+                entry[0].set()
+        try:
+            self._req_q = multiprocessing.Queue()
+            self._resp_q = multiprocessing.Queue()
+            self._worker = multiprocessing.Process(
+                target=_engine_worker, args=(self._req_q, self._resp_q), daemon=True)
+            self._worker.start()
+            threading.Thread(target=self._drain_responses,
+                             args=(self._resp_q,), daemon=True).start()
+            return True
+        except Exception:
+            self._worker = None
+            return False
+
+    def _drain_responses(self, resp_q):
+        """Route worker responses to the pool threads waiting on them"""
+        while True:
+            try:
+                req_id, ok, payload = resp_q.get()
+            except (EOFError, OSError):
+                break
+            entry = self._worker_results.pop(req_id, None)
+            if entry is not None:
+                entry[1] = (ok, payload)
+                entry[0].set()
+
+    def _engine_call(self, method, *args):
+        """Run an engine method, preferring the isolated worker process.
+
+        Called from pool threads; blocks until the worker answers. If the
+        worker cannot start at all, falls back to an in-process engine.
+        """
+        with self._worker_lock:
+            alive = self._ensure_worker()
+            if alive:
+                # Snapshot the process this request is queued to; another
+                # thread may restart self._worker while we wait, and
+                # liveness must be judged against our worker, not its
+                # replacement
+                worker = self._worker
+                self._req_seq += 1
+                req_id = self._req_seq
+                entry = [threading.Event(), None]
+                self._worker_results[req_id] = entry
+                self._req_q.put((req_id, method, args))
+
+        if not alive:
+            if self.job_hunter is None:
+                self.job_hunter = SmartJobHunterAI()
+            return getattr(self.job_hunter, method)(*args)
+
+        # Poll so a crashed worker surfaces as an error instead of a hang
+        while not entry[0].wait(1.0):
+            if not worker.is_alive() and not entry[0].is_set():
+                self._worker_results.pop(req_id, None)
+                raise RuntimeError("Analysis worker died - please retry")
+        ok, payload = entry[1]
+        if not ok:
+            raise RuntimeError(payload)
+        return payload
+
+    def _cached_call(self, key_parts, producer):
+        """Memoize an expensive engine call, evicting least-recently-used.
+
+        key_parts is a tuple of strings identifying the call (method name
+        plus normalized arguments); producer runs the real call on a miss.
+        """
+        key = hashlib.sha1('\x00'.join(key_parts).encode()).hexdigest()
+        if key in self._call_cache:
+            self._call_cache.move_to_end(key)
+            return self._call_cache[key]
+        result = producer()
+        self._call_cache[key] = result
+        if len(self._call_cache) > CALL_CACHE_LIMIT:
+            self._call_cache.popitem(last=False)
+        return result
+
+    def _cached_get(self, key_parts):
+        """Return a memoized call result, or None if not cached"""
+        key = hashlib.sha1('\x00'.join(key_parts).encode()).hexdigest()
+        if key in self._call_cache:
+            self._call_cache.move_to_end(key)
+            return self._call_cache[key]
+        return None
+
+    def _cache_key(self, url):
+        """Cache key for a job URL under the current analysis depth"""
+        return hashlib.sha1((url.strip().lower() + self.depth_var.get()).encode()).hexdigest()
+
     def analyze_job(self):
         """Analyze a job posting from URL"""
-        if not self.job_hunter:
+        if SmartJobHunterAI is None:
             messagebox.showerror("Error", "Smart Job Hunter AI not available")
             return
             
@@ -637,33 +988,125 @@ class SmartJobHunterGUI:
         if not url:
             messagebox.showwarning("Warning", "Please enter a job URL")
             return
-        
+
+        # Serve repeat analyses straight from the cache - no thread, no API call
+        key = self._cache_key(url)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            self.current_analysis = cached
+            self.display_job_analysis(cached)
+            return
+
+        # Ignore repeat clicks while this URL is already being analyzed
+        inflight = self._inflight.get(url)
+        if inflight is not None and not inflight.done():
+            return
+
         # Show loading state
         self.show_loading_state("Analyzing job posting...")
-        
-        # Run analysis in separate thread
-        def analyze():
-            try:
-                analysis = self.job_hunter.analyze_job_posting(url)
-                if analysis:
-                    self.current_analysis = analysis
-                    self.root.after(0, self.display_job_analysis, analysis)
-                    self.root.after(0, self.hide_loading_state)
-                else:
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Failed to analyze job posting"))
-                    self.root.after(0, self.hide_loading_state)
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Analysis failed: {str(e)}"))
-                self.root.after(0, self.hide_loading_state)
-        
-        threading.Thread(target=analyze, daemon=True).start()
-    
+        self.analyze_btn.state(['disabled'])
+
+        # Run analysis on the shared pool
+        future = self._pool.submit(self._engine_call, 'analyze_job_posting', url)
+        self._inflight[url] = future
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_analysis_done, url, key, f))
+
+    def _on_analysis_done(self, url, key, future):
+        """Handle a finished analysis future on the Tk thread"""
+        self._inflight.pop(url, None)
+        self.analyze_btn.state(['!disabled'])
+        self.hide_loading_state()
+        try:
+            analysis = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Analysis failed: {str(e)}")
+            return
+        if not analysis:
+            messagebox.showerror("Error", "Failed to analyze job posting")
+            return
+        self.current_analysis = analysis
+        self._analysis_cache[key] = analysis
+        self.display_job_analysis(analysis)
+
+    def analyze_jobs_batch(self, urls):
+        """Analyze many job URLs concurrently on the shared pool.
+
+        Results land in the analysis cache and the history view
+        incrementally as each future completes, so an N-URL import takes
+        roughly the longest single analysis rather than the sum of all N.
+        """
+        if SmartJobHunterAI is None:
+            messagebox.showerror("Error", "Smart Job Hunter AI not available")
+            return
+        urls = [u.strip() for u in urls if u.strip()]
+        if not urls:
+            messagebox.showwarning("Warning", "No job URLs to analyze")
+            return
+
+        self._batch_total = len(urls)
+        self._batch_done = 0
+        self.log_integration_activity(f"Batch analysis started for {len(urls)} jobs")
+
+        for url in urls:
+            key = self._cache_key(url)
+            cached = self._analysis_cache.get(key)
+            if cached is not None:
+                # Already analyzed this session or a previous one
+                self._batch_done += 1
+                self.add_to_history(cached)
+                continue
+            inflight = self._inflight.get(url)
+            if inflight is not None and not inflight.done():
+                self._batch_total -= 1
+                continue
+            future = self._pool.submit(self._engine_call, 'analyze_job_posting', url)
+            self._inflight[url] = future
+            future.add_done_callback(
+                lambda f, u=url, k=key: self.root.after(0, self._on_batch_item_done, u, k, f))
+
+        if self._batch_done == self._batch_total:
+            self.log_integration_activity("Batch analysis complete (all served from cache)")
+
+    def _on_batch_item_done(self, url, key, future):
+        """Record one finished batch item on the Tk thread"""
+        self._inflight.pop(url, None)
+        self._batch_done += 1
+        try:
+            analysis = future.result()
+        except Exception as e:
+            analysis = None
+            self.log_integration_activity(f"Batch item failed ({url}): {str(e)}")
+        if analysis:
+            self._analysis_cache[key] = analysis
+            self.add_to_history(analysis)
+            self.log_integration_activity(
+                f"Batch {self._batch_done}/{self._batch_total}: analyzed {analysis.job_title}")
+        if self._batch_done >= self._batch_total:
+            self.log_integration_activity("Batch analysis complete")
+
     def display_job_analysis(self, analysis):
         """Display job analysis results"""
-        # Clear previous results
-        self.job_details_text.delete(1.0, tk.END)
-        self.ai_analysis_text.delete(1.0, tk.END)
-        
+        # Re-showing an analysis (cache hits, history views) skips the
+        # whole formatting pass and reuses the rendered pane texts
+        cached = getattr(analysis, '_rendered_panes', None)
+        if cached is not None:
+            self._set_text(self.job_details_text, cached[0])
+            self._set_text(self.ai_analysis_text, cached[1])
+            return
+
+        # Bullet blocks come from the memoized helper, so re-displaying an
+        # analysis reuses the already-joined strings
+        requirements = _bulletize(tuple(analysis.requirements))
+        recommendations = _bulletize(tuple(analysis.recommendations))
+        talking_points = _bulletize(tuple(analysis.talking_points))
+        improvement_areas = _bulletize(tuple(analysis.improvement_areas))
+
+        # Only slice-and-copy long descriptions; short ones pass through
+        desc = analysis.job_description
+        if len(desc) > 1000:
+            desc = desc[:1000] + '...'
+
         # Display job details
         job_info = f"""Job Title: {analysis.job_title}
 Company: {analysis.company_name}
@@ -672,7 +1115,7 @@ Salary: {analysis.salary_range if analysis.salary_range else 'Not specified'}
 Job Type: {analysis.job_type}
 
 Job Description:
-{analysis.job_description[:1000]}{'...' if len(analysis.job_description) > 1000 else ''}
+{desc}
 
 Required Skills:
 {', '.join(analysis.required_skills)}
@@ -681,10 +1124,12 @@ Preferred Skills:
 {', '.join(analysis.preferred_skills)}
 
 Requirements:
-{chr(10).join([f"• {req}" for req in analysis.requirements])}"""
-        
-        self.job_details_text.insert(1.0, job_info)
-        
+{requirements}"""
+
+        # replace() swaps the content in one Tk call - no delete round-trip
+        # and no re-layout of a momentarily empty widget
+        self._set_text(self.job_details_text, job_info)
+
         # Display AI analysis
         ai_analysis = f"""Match Score: {analysis.match_score}/100
 
@@ -698,16 +1143,22 @@ Culture Fit Assessment:
 {analysis.culture_fit}
 
 Application Recommendations:
-{chr(10).join([f"• {rec}" for rec in analysis.recommendations])}
+{recommendations}
 
 Key Talking Points:
-{chr(10).join([f"• {point}" for point in analysis.talking_points])}
+{talking_points}
 
 Areas for Improvement:
-{chr(10).join([f"• {area}" for area in analysis.improvement_areas])}"""
-        
-        self.ai_analysis_text.insert(1.0, ai_analysis)
-        
+{improvement_areas}"""
+
+        self._set_text(self.ai_analysis_text, ai_analysis)
+
+        try:
+            analysis._rendered_panes = (job_info, ai_analysis)
+        except AttributeError:
+            # Slotted or frozen analysis objects just re-render each time
+            pass
+
         # Add to history
         self.add_to_history(analysis)
         
@@ -716,7 +1167,7 @@ Areas for Improvement:
     
     def research_company(self):
         """Research a company"""
-        if not self.job_hunter:
+        if SmartJobHunterAI is None:
             messagebox.showerror("Error", "Smart Job Hunter AI not available")
             return
             
@@ -725,102 +1176,174 @@ Areas for Improvement:
             messagebox.showwarning("Warning", "Please enter a company name")
             return
         
+        # A repeat lookup of the same company renders straight from the
+        # cache - no thread, no loading state, no engine round-trip
+        cached = self._cached_get(('research_company', company_name.lower()))
+        if cached is not None:
+            self.display_company_intelligence(cached)
+            return
+
+        # Ignore repeat clicks while this company is already being researched
+        inflight_key = f"company:{company_name.lower()}"
+        inflight = self._inflight.get(inflight_key)
+        if inflight is not None and not inflight.done():
+            return
+
         # Show loading state
         self.show_loading_state("Researching company...")
-        
-        def research():
-            try:
-                intelligence = self.job_hunter.research_company(company_name)
-                if intelligence:
-                    self.root.after(0, self.display_company_intelligence, intelligence)
-                    self.root.after(0, self.hide_loading_state)
-                else:
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Failed to research company"))
-                    self.root.after(0, self.hide_loading_state)
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Research failed: {str(e)}"))
-                self.root.after(0, self.hide_loading_state)
-        
-        threading.Thread(target=research, daemon=True).start()
-    
+        self.research_btn.state(['disabled'])
+
+        future = self._pool.submit(
+            self._cached_call, ('research_company', company_name.lower()),
+            lambda: self._engine_call('research_company', company_name))
+        self._inflight[inflight_key] = future
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_research_done, inflight_key, f))
+
+    def _on_research_done(self, inflight_key, future):
+        """Handle a finished company-research future on the Tk thread"""
+        self._inflight.pop(inflight_key, None)
+        self.research_btn.state(['!disabled'])
+        self.hide_loading_state()
+        try:
+            intelligence = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Research failed: {str(e)}")
+            return
+        if not intelligence:
+            messagebox.showerror("Error", "Failed to research company")
+            return
+        self.display_company_intelligence(intelligence)
+
     def display_company_intelligence(self, intelligence):
         """Display company intelligence results"""
-        # Clear previous results
-        self.company_overview_text.delete(1.0, tk.END)
-        self.culture_analysis_text.delete(1.0, tk.END)
-        self.financial_health_text.delete(1.0, tk.END)
-        self.company_news_text.delete(1.0, tk.END)
-        
+        # Each pane is handed to Tk as its own idle task below, so the
+        # mainloop can process redraws between the four multi-KB layouts
+        # Bind every scalar field to a local up front - each block below
+        # would otherwise re-walk the attribute chain per interpolation
+        name = intelligence.company_name
+        industry = intelligence.industry
+        size = intelligence.company_size
+        founded = intelligence.founded_year
+        headquarters = intelligence.headquarters
+        description = intelligence.company_description
+        culture_score = intelligence.culture_score
+        work_environment = intelligence.work_environment
+        growth_opportunities = intelligence.growth_opportunities
+        work_life_balance = intelligence.work_life_balance
+        financial_health = intelligence.financial_health
+        revenue = intelligence.revenue if intelligence.revenue else 'Private/Not disclosed'
+        employee_count = intelligence.employee_count
+        recent_funding = intelligence.recent_funding if intelligence.recent_funding else 'Not applicable'
+        market_position = intelligence.market_position
+        growth_trajectory = intelligence.growth_trajectory
+
+        # Memoized bullet blocks; each pane is then written with a single
+        # replace() call instead of a delete+insert pair
+        key_people = _bulletize(tuple(intelligence.key_people))
+        products_services = _bulletize(tuple(intelligence.products_services))
+        company_values = _bulletize(tuple(intelligence.company_values))
+        employee_benefits = _bulletize(tuple(intelligence.employee_benefits))
+        competitive_advantages = _bulletize(tuple(intelligence.competitive_advantages))
+        recent_news = _bulletize(tuple(intelligence.recent_news))
+        awards_recognition = _bulletize(tuple(intelligence.awards_recognition))
+        challenges = _bulletize(tuple(intelligence.challenges))
+
         # Display company overview
-        overview = f"""Company: {intelligence.company_name}
-Industry: {intelligence.industry}
-Size: {intelligence.company_size}
-Founded: {intelligence.founded_year}
-Headquarters: {intelligence.headquarters}
+        overview = f"""Company: {name}
+Industry: {industry}
+Size: {size}
+Founded: {founded}
+Headquarters: {headquarters}
 
 About:
-{intelligence.company_description}
+{description}
 
 Key Leadership:
-{chr(10).join([f"• {leader}" for leader in intelligence.key_people])}
+{key_people}
 
 Products/Services:
-{chr(10).join([f"• {product}" for product in intelligence.products_services])}"""
-        
-        self.company_overview_text.insert(1.0, overview)
-        
+{products_services}"""
+
+        self.root.after_idle(self._set_text, self.company_overview_text, overview)
+
         # Display culture analysis
-        culture = f"""Culture Score: {intelligence.culture_score}/100
+        culture = f"""Culture Score: {culture_score}/100
 
 Work Environment:
-{intelligence.work_environment}
+{work_environment}
 
 Company Values:
-{chr(10).join([f"• {value}" for value in intelligence.company_values])}
+{company_values}
 
 Employee Benefits:
-{chr(10).join([f"• {benefit}" for benefit in intelligence.employee_benefits])}
+{employee_benefits}
 
 Growth Opportunities:
-{intelligence.growth_opportunities}
+{growth_opportunities}
 
 Work-Life Balance:
-{intelligence.work_life_balance}"""
-        
-        self.culture_analysis_text.insert(1.0, culture)
-        
+{work_life_balance}"""
+
+        self.root.after_idle(self._set_text, self.culture_analysis_text, culture)
+
         # Display financial health
-        financial = f"""Financial Health Score: {intelligence.financial_health}/100
+        financial = f"""Financial Health Score: {financial_health}/100
 
-Revenue: {intelligence.revenue if intelligence.revenue else 'Private/Not disclosed'}
-Employee Count: {intelligence.employee_count}
-Recent Funding: {intelligence.recent_funding if intelligence.recent_funding else 'Not applicable'}
+Revenue: {revenue}
+Employee Count: {employee_count}
+Recent Funding: {recent_funding}
 
 Market Position:
-{intelligence.market_position}
+{market_position}
 
 Competitive Advantages:
-{chr(10).join([f"• {advantage}" for advantage in intelligence.competitive_advantages])}
+{competitive_advantages}
 
 Growth Trajectory:
-{intelligence.growth_trajectory}"""
-        
-        self.financial_health_text.insert(1.0, financial)
-        
+{growth_trajectory}"""
+
+        self.root.after_idle(self._set_text, self.financial_health_text, financial)
+
         # Display recent news
         news = f"""Recent Company News and Updates:
 
-{chr(10).join([f"• {news_item}" for news_item in intelligence.recent_news])}
+{recent_news}
 
 Industry Recognition:
-{chr(10).join([f"• {award}" for award in intelligence.awards_recognition])}
+{awards_recognition}
 
 Challenges and Risks:
-{chr(10).join([f"• {challenge}" for challenge in intelligence.challenges])}"""
-        
-        self.company_news_text.insert(1.0, news)
+{challenges}"""
+
+        self.root.after_idle(self._set_text, self.company_news_text, news)
     
     # Utility methods
+    @staticmethod
+    def _set_text(widget, text):
+        """Replace a Text widget's full content in one Tk call.
+
+        replace() avoids the delete-then-insert double round-trip and the
+        re-layout of a momentarily empty widget.
+        """
+        widget.replace('1.0', 'end', text)
+
+    def _debounce(self, key, fn, delay=150):
+        """Run fn once per event burst, delay ms after the last event"""
+        timer = self._timers.get(key)
+        if timer is not None:
+            self.root.after_cancel(timer)
+        self._timers[key] = self.root.after(delay, fn)
+
+    def _validate_url(self):
+        """Tidy the URL entry after a burst of typing or paste events"""
+        self._timers.pop('url', None)
+        url = self.job_url_entry.get()
+        cleaned = url.strip()
+        if cleaned != url:
+            self.job_url_entry.delete(0, tk.END)
+            self.job_url_entry.insert(0, cleaned)
+
     def show_loading_state(self, message):
         """Show loading state in UI"""
         # This would be implemented with a loading overlay or progress bar
@@ -835,37 +1358,195 @@ Challenges and Risks:
         """Log integration activity"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] {message}\n"
-        self.integration_log.insert(tk.END, log_entry)
+        # The log widget only exists once the Integration Hub tab has been
+        # opened - hold entries until then
+        if "Integration Hub" not in self._built:
+            self._pending_log.append(log_entry)
+            return
+        # Coalesce bursts: buffer the entry and flush once per tick, so N
+        # messages in quick succession cost one insert and one layout pass
+        self._log_buffer.append(log_entry)
+        if self._log_flush_id is None:
+            self._log_flush_id = self.root.after(50, self._flush_log)
+
+    def _flush_log(self):
+        """Write all buffered log entries in a single insert"""
+        self._log_flush_id = None
+        if not self._log_buffer:
+            return
+        self.integration_log.insert(tk.END, ''.join(self._log_buffer))
+        self._log_buffer.clear()
+        # Text widget cost grows with total content; once the overshoot
+        # passes the slack, drop everything older than the newest
+        # LOG_MAX_LINES in a single batched delete
+        lines = int(self.integration_log.index('end-1c').split('.')[0])
+        if lines > LOG_MAX_LINES + LOG_TRIM_SLACK:
+            self.integration_log.delete('1.0', f'{lines - LOG_MAX_LINES}.0')
         self.integration_log.see(tk.END)
     
     def add_to_history(self, analysis):
         """Add job analysis to history"""
-        self.job_history.append({
+        self._history_seq += 1
+        job = {
+            'id': f"job-{self._session_tag}-{self._history_seq}",
+            # Tie-breaker for sorting: the date only has day granularity,
+            # so same-day entries order by insertion
+            'seq': self._history_seq,
             'date': datetime.now().strftime("%Y-%m-%d"),
             'company': analysis.company_name,
             'position': analysis.job_title,
             'status': 'Analyzed',
             'score': analysis.match_score,
-            'analysis': analysis
-        })
-        self.refresh_history_display()
-    
+            # Formatted once here instead of on every Treeview refresh
+            'score_str': f"{analysis.match_score}/100",
+            # Keep only the field the detail view reads; the full object
+            # would pin the 1000-char description and every list per entry
+            'skill_analysis': getattr(analysis, 'skill_analysis', None)
+        }
+        if len(self.job_history) == self.job_history.maxlen:
+            # The deque is about to evict its oldest entry; drop the
+            # matching id lookup so the dict stays window-sized too
+            self._history_by_id.pop(self.job_history[0]['id'], None)
+        self.job_history.append(job)
+        self._history_by_id[job['id']] = job
+
+        # Persist immediately; the payload BLOB is only read back lazily
+        if dataclasses.is_dataclass(analysis):
+            payload = json.dumps(dataclasses.asdict(analysis), default=str)
+        else:
+            payload = json.dumps(getattr(analysis, '__dict__', {}), default=str)
+        self._history_db.execute(
+            "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job['id'], job['date'], job['company'], job['position'],
+             job['status'], job['score'], payload))
+        self._history_db.commit()
+
+        self._prepend_history_row(job)
+
+    @staticmethod
+    def _row_values(job):
+        """Column values for one history Treeview row"""
+        return (job['date'], job['company'], job['position'],
+                job['status'], job['score_str'], "View")
+
+    def _prepend_history_row(self, job):
+        """O(1) fast path for one new analysis: a single insert at the top.
+
+        A new entry is always the newest, so prepending preserves the
+        reverse-chronological order without the sort-and-diff refresh.
+        """
+        self._display_jobs.insert(0, job)
+        if "Job History" not in self._built:
+            return
+        if self._win_start != 0:
+            # The view is paged away from the top; the windowed refresh
+            # picks the row up when the user scrolls back
+            return
+        self._history_items[job['id']] = self.history_tree.insert(
+            '', 0, iid=job['id'], values=self._row_values(job))
+        # Keep the attached page bounded; the detached row reattaches on
+        # the next window refresh that includes it
+        children = self.history_tree.get_children()
+        if len(children) > HISTORY_PAGE:
+            self.history_tree.detach(children[-1])
+
+    def _load_history(self):
+        """Load the newest window of history rows, without payloads"""
+        rows = self._history_db.execute(
+            "SELECT id, date, company, position, status, score FROM jobs "
+            "ORDER BY date DESC LIMIT ?", (HISTORY_WINDOW,)).fetchall()
+        # Rows arrive newest-first; iterating reversed assigns ascending
+        # seq values in chronological order, and bumping _history_seq
+        # keeps entries added later in this session sorting above them
+        for job_id, date, company, position, status, score in reversed(rows):
+            self._history_seq += 1
+            job = {
+                'id': job_id,
+                'seq': self._history_seq,
+                'date': date,
+                'company': company,
+                'position': position,
+                'status': status,
+                'score': score,
+                'score_str': f"{score}/100",
+                'skill_analysis': None
+            }
+            self.job_history.append(job)
+            self._history_by_id[job_id] = job
+        if rows:
+            self.refresh_history_display()
+
     def refresh_history_display(self):
         """Refresh the history display"""
-        # Clear existing items
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
-        
-        # Add history items
-        for job in reversed(self.job_history):  # Show most recent first
-            self.history_tree.insert('', 'end', values=(
-                job['date'],
-                job['company'],
-                job['position'],
-                job['status'],
-                f"{job['score']}/100",
-                "View"
-            ))
+        # Nothing to refresh until the Job History tab has been built; the
+        # builder repopulates from self.job_history when it first runs
+        if "Job History" not in self._built:
+            return
+
+        # Newest first, sorted in Python rather than via Tcl callbacks.
+        # The insertion seq breaks date ties - the date is day-granular,
+        # so without it a single-day session would render oldest-first
+        self._display_jobs = sorted(self.job_history,
+                                    key=itemgetter('date', 'seq'),
+                                    reverse=True)
+        self._show_window(self._win_start)
+
+    def _show_window(self, start):
+        """Render one HISTORY_PAGE-sized slice of the history in the tree.
+
+        The widget never holds more than HISTORY_PAGE rows no matter how
+        large the history grows; rows are diffed against what is already
+        displayed so unchanged ones are moved, not rebuilt.
+        """
+        jobs = self._display_jobs
+        start = max(0, min(start, max(0, len(jobs) - HISTORY_PAGE)))
+        self._win_start = start
+        window = jobs[start:start + HISTORY_PAGE]
+        window_ids = {job['id'] for job in window}
+        all_ids = {job['id'] for job in jobs}
+
+        for job_id in list(self._history_items):
+            if job_id in window_ids:
+                continue
+            iid = self._history_items[job_id]
+            if job_id in all_ids:
+                # Still in the history, just scrolled out of the window -
+                # detach keeps the built row around for a cheap reattach
+                self.history_tree.detach(iid)
+            else:
+                self.history_tree.delete(iid)
+                del self._history_items[job_id]
+
+        new_count = sum(1 for job in window if job['id'] not in self._history_items)
+        # Hide columns during bulk inserts so Tk lays them out once at the end
+        bulk = new_count > 1
+        if bulk:
+            self.history_tree.configure(displaycolumns=())
+        for pos, job in enumerate(window):
+            iid = self._history_items.get(job['id'])
+            if iid is None:
+                self._history_items[job['id']] = self.history_tree.insert(
+                    '', pos, iid=job['id'], values=self._row_values(job))
+            else:
+                self.history_tree.move(iid, '', pos)
+        if bulk:
+            self.history_tree.configure(displaycolumns='#all')
+
+    def _on_history_yset(self, first, last):
+        """Update the scrollbar and page the window at the view's edges"""
+        self._history_vbar.set(first, last)
+        if float(first) <= 0.0 and self._win_start > 0:
+            self._debounce('history_page', self._page_history_up, delay=50)
+        elif float(last) >= 1.0 and self._win_start + HISTORY_PAGE < len(self._display_jobs):
+            self._debounce('history_page', self._page_history_down, delay=50)
+
+    def _page_history_up(self):
+        self._show_window(self._win_start - HISTORY_PAGE // 2)
+        self.history_tree.yview_moveto(0.5)
+
+    def _page_history_down(self):
+        self._show_window(self._win_start + HISTORY_PAGE // 2)
+        self.history_tree.yview_moveto(0.5)
     
     # Placeholder methods for various actions
     def paste_from_clipboard(self):
@@ -874,12 +1555,18 @@ Challenges and Risks:
             clipboard_content = self.root.clipboard_get()
             self.job_url_entry.delete(0, tk.END)
             self.job_url_entry.insert(0, clipboard_content)
+            self._debounce('url', self._validate_url)
         except:
             messagebox.showwarning("Warning", "Clipboard is empty or contains invalid data")
     
     def load_saved_jobs(self):
-        """Load previously saved jobs"""
-        messagebox.showinfo("Info", "Load saved jobs functionality will be implemented")
+        """Load previously saved analyses into the history view"""
+        if not self._analysis_cache:
+            messagebox.showinfo("Info", "No saved jobs found")
+            return
+        for analysis in self._analysis_cache.values():
+            self.add_to_history(analysis)
+        self.log_integration_activity(f"Loaded {len(self._analysis_cache)} saved job analyses")
     
     def import_job_description(self):
         """Import job description from file"""
@@ -888,19 +1575,43 @@ Challenges and Risks:
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
         )
         if file_path:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                # Process the content as a job description
-                messagebox.showinfo("Success", "Job description imported successfully")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to import file: {str(e)}")
+            # Read on the worker pool so a large file never stalls redraws
+            future = self._pool.submit(self._read_description, file_path)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._apply_imported_description, f))
+
+    @staticmethod
+    def _read_description(file_path):
+        """Pool-side file read; a large buffer keeps the I/O to a few calls"""
+        with open(file_path, 'r', encoding='utf-8', buffering=65536) as f:
+            return f.read()
+
+    def _apply_imported_description(self, future):
+        """Back on the Tk thread: show the imported description"""
+        try:
+            content = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to import file: {str(e)}")
+            return
+        self._set_text(self.job_details_text, content)
+        messagebox.showinfo("Success", "Job description imported successfully")
     
     def save_analysis(self):
         """Save current analysis"""
         if not self.current_analysis:
             messagebox.showwarning("Warning", "No analysis to save")
             return
+        # Persist the whole cache so analyses survive restarts
+        try:
+            payload = {}
+            for cache_key, analysis in self._analysis_cache.items():
+                if dataclasses.is_dataclass(analysis):
+                    payload[cache_key] = dataclasses.asdict(analysis)
+            with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save analysis: {str(e)}")
+            return
         messagebox.showinfo("Info", "Analysis saved successfully")
     
     def generate_application(self):
@@ -908,6 +1619,9 @@ Challenges and Risks:
         if not self.current_analysis:
             messagebox.showwarning("Warning", "Please analyze a job first")
             return
+        # Build the strategy tab before writing into its text widgets - the
+        # <<NotebookTabChanged>> event from select() may arrive later
+        self._build_tab("Application Strategy")
         self.notebook.select(2)  # Switch to Application Strategy tab
         self.generate_strategy()
     
@@ -919,118 +1633,83 @@ Challenges and Risks:
         self.log_integration_activity(f"Sending job analysis to Learning Coach: {self.current_analysis.job_title}")
         messagebox.showinfo("Success", "Job data sent to Learning Coach for skill analysis")
     
+    def _focus_mask(self):
+        """Snapshot the focus-area checkboxes as a single int bitmask"""
+        return sum(1 << i
+                   for i, (_, var) in enumerate(sorted(self.focus_vars.items()))
+                   if var.get())
+
     def generate_strategy(self):
         """Generate application strategy"""
         if not self.current_analysis:
             messagebox.showwarning("Warning", "Please analyze a job first")
             return
-        
-        # Mock strategy generation
-        cover_letter = f"""Dear Hiring Manager,
-
-I am writing to express my strong interest in the {self.current_analysis.job_title} position at {self.current_analysis.company_name}. With my background in software development and AI systems, I am excited about the opportunity to contribute to your team.
-
-Based on my analysis of the role, I have identified several key areas where my experience aligns perfectly with your requirements:
-
-{chr(10).join([f"• {skill}" for skill in self.current_analysis.required_skills[:5]])}
-
-I am particularly drawn to {self.current_analysis.company_name} because of your innovative approach to technology and commitment to excellence. I believe my passion for AI and automation makes me an ideal candidate for this role.
-
-I would welcome the opportunity to discuss how my skills and experience can contribute to your team's success.
-
-Best regards,
-[Your Name]"""
-        
-        self.cover_letter_text.delete(1.0, tk.END)
-        self.cover_letter_text.insert(1.0, cover_letter)
-        
-        # Resume optimization
-        resume_tips = f"""Resume Optimization Recommendations for {self.current_analysis.job_title}:
-
-1. HIGHLIGHT THESE SKILLS:
-{chr(10).join([f"   • {skill}" for skill in self.current_analysis.required_skills[:8]])}
-
-2. EXPERIENCE ALIGNMENT:
-   • Emphasize projects that demonstrate {self.current_analysis.required_skills[0]} experience
-   • Quantify achievements with metrics and results
-   • Include relevant technologies: {', '.join(self.current_analysis.preferred_skills[:5])}
-
-3. KEYWORDS TO INCLUDE:
-   {', '.join(self.current_analysis.required_skills + self.current_analysis.preferred_skills)}
 
-4. RECOMMENDED SECTIONS:
-   • Technical Skills (prominently featured)
-   • Relevant Projects
-   • Professional Experience
-   • Certifications
-   • Education
+        # The checkbox state collapses to one int, so the whole strategy
+        # configuration becomes a small hashable cache key - regenerating
+        # with unchanged settings is a dict lookup
+        key = ('generate_strategy', str(self._focus_mask()), self.app_type_var.get(),
+               self.current_analysis.job_title, self.current_analysis.company_name)
+        texts = self._cached_get(key)
+        if texts is not None:
+            self._apply_strategy(texts)
+            return
 
-5. TAILORING SUGGESTIONS:
-   • Customize project descriptions to match job requirements
-   • Use industry-specific terminology
-   • Highlight leadership and collaboration experiences"""
-        
-        self.resume_opt_text.delete(1.0, tk.END)
-        self.resume_opt_text.insert(1.0, resume_tips)
-        
-        # Interview preparation
-        interview_prep = f"""Interview Preparation for {self.current_analysis.job_title}:
+        # Build the four multi-KB documents on the worker pool so a long
+        # skills list cannot freeze the mainloop; only the widget writes
+        # happen back on the Tk thread
+        future = self._pool.submit(self._cached_call, key, self._build_strategy_texts)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._apply_strategy_future, f))
 
-TECHNICAL QUESTIONS TO EXPECT:
-{chr(10).join([f"• How do you approach {skill.lower()}?" for skill in self.current_analysis.required_skills[:5]])}
+    def _apply_strategy_future(self, future):
+        """Unwrap a finished strategy future on the Tk thread"""
+        try:
+            texts = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Strategy generation failed: {str(e)}")
+            return
+        self._apply_strategy(texts)
 
-BEHAVIORAL QUESTIONS:
-• Tell me about a challenging project you've worked on
-• How do you handle competing priorities?
-• Describe a time you had to learn a new technology quickly
-• How do you collaborate with cross-functional teams?
+    def _apply_strategy(self, texts):
+        """Write the four strategy documents into their panes"""
+        cover_letter, resume_tips, interview_prep, followup_strategy = texts
+        self._set_text(self.cover_letter_text, cover_letter)
+        self._set_text(self.resume_opt_text, resume_tips)
+        self._set_text(self.interview_prep_text, interview_prep)
+        self._set_text(self.followup_text, followup_strategy)
+        messagebox.showinfo("Success", "Application strategy generated successfully")
 
-QUESTIONS TO ASK THEM:
-• What are the biggest technical challenges the team is facing?
-• How does the team approach professional development?
-• What does success look like in this role after 6 months?
-• Can you tell me about the team culture and collaboration style?
+    def _build_strategy_texts(self):
+        """Render the four strategy documents for the current analysis"""
+        # Bind the attribute chain and slice each list once; the same
+        # slices feed several templates below
+        analysis = self.current_analysis
+        title = analysis.job_title
+        company = analysis.company_name
+        req = analysis.required_skills
+        pref = analysis.preferred_skills
+        top5 = req[:5]
+        top8 = req[:8]
+        pref5 = ', '.join(pref[:5])
+        keywords = ', '.join(req + pref)
 
-PREPARATION TASKS:
-• Research {self.current_analysis.company_name}'s recent projects and news
-• Prepare specific examples that demonstrate required skills
-• Review fundamentals of key technologies
-• Practice explaining complex technical concepts simply"""
-        
-        self.interview_prep_text.delete(1.0, tk.END)
-        self.interview_prep_text.insert(1.0, interview_prep)
-        
-        # Follow-up strategy
-        followup_strategy = f"""Follow-up Strategy for {self.current_analysis.company_name}:
+        # Pre-join the bullet blocks as generators over the constants
+        skills_block = _NL.join(_BULLET + skill for skill in top5)
+        highlight_block = _NL.join("   " + _BULLET + skill for skill in top8)
+        question_block = _NL.join(
+            f"{_BULLET}How do you approach {skill.lower()}?" for skill in top5)
 
-TIMELINE:
-Day 1: Submit application
-Day 2-3: Connect with hiring manager on LinkedIn
-Day 7: Follow-up email if no response
-Day 14: Second follow-up with additional value
+        cover_letter = self._COVER_LETTER_TMPL.format(
+            title=title, company=company, skills_block=skills_block)
+        resume_tips = self._RESUME_TMPL.format(
+            title=title, first_skill=req[0], pref5=pref5, keywords=keywords,
+            highlight_block=highlight_block)
+        interview_prep = self._INTERVIEW_TMPL.format(
+            title=title, company=company, question_block=question_block)
+        followup_strategy = self._FOLLOWUP_TMPL.format(company=company)
 
-FOLLOW-UP MESSAGES:
-1. Thank you note after application
-2. LinkedIn connection request with personalized note
-3. Value-added follow-up (relevant article, insight, or project)
-4. Final gentle reminder before moving on
-
-NETWORKING APPROACH:
-• Connect with current employees in similar roles
-• Engage with company content on social media
-• Attend company events or webinars if available
-• Look for warm introductions through mutual connections
-
-TRACKING:
-• Application submission date
-• Response dates and next steps
-• Interview dates and feedback
-• Final decision and lessons learned"""
-        
-        self.followup_text.delete(1.0, tk.END)
-        self.followup_text.insert(1.0, followup_strategy)
-        
-        messagebox.showinfo("Success", "Application strategy generated successfully")
+        return cover_letter, resume_tips, interview_prep, followup_strategy
     
     def refresh_prediction(self):
         """Refresh success prediction"""
@@ -1038,28 +1717,34 @@ TRACKING:
             messagebox.showwarning("Warning", "Please analyze a job first")
             return
         
-        # Mock prediction
-        self.success_score_label.config(text=f"{self.current_analysis.match_score}%")
-        
+        # Mock prediction - compute each derived score once up front
+        score = self.current_analysis.match_score
+        skills_pct = min(95, score + 10)
+        exp_pct = max(70, score - 15)
+        tier = ('low', 'moderate', 'high', 'excellent')[min(3, score // 25)]
+        self.success_score_label.config(text=f"{score}%")
+
+        improvement_block = _bulletize(tuple(self.current_analysis.improvement_areas))
+
         prediction_analysis = f"""Success Prediction Analysis for {self.current_analysis.job_title}:
 
-OVERALL SCORE: {self.current_analysis.match_score}/100
+OVERALL SCORE: {score}/100
 
 CONTRIBUTING FACTORS:
-• Skills Match: {min(95, self.current_analysis.match_score + 10)}/100
-• Experience Alignment: {max(70, self.current_analysis.match_score - 15)}/100
+• Skills Match: {skills_pct}/100
+• Experience Alignment: {exp_pct}/100
 • Market Demand: 85/100
 • Application Quality: 90/100
 
 DETAILED BREAKDOWN:
-The analysis shows a {['low', 'moderate', 'high', 'excellent'][min(3, self.current_analysis.match_score // 25)]} probability of success based on:
+The analysis shows a {tier} probability of success based on:
 
-1. Technical Skills Match ({min(95, self.current_analysis.match_score + 10)}/100):
+1. Technical Skills Match ({skills_pct}/100):
    - Strong alignment with required technologies
    - Relevant project experience
    - Growth potential in key areas
 
-2. Experience Level ({max(70, self.current_analysis.match_score - 15)}/100):
+2. Experience Level ({exp_pct}/100):
    - Years of experience align with requirements
    - Industry background is relevant
    - Leadership experience is valuable
@@ -1070,25 +1755,22 @@ The analysis shows a {['low', 'moderate', 'high', 'excellent'][min(3, self.curre
    - Company is actively hiring
 
 RECOMMENDATIONS FOR IMPROVEMENT:
-{chr(10).join([f"• {area}" for area in self.current_analysis.improvement_areas])}
+{improvement_block}
 
 NEXT STEPS:
 • Enhance application with specific examples
 • Prepare targeted interview responses
 • Consider additional skill development in key areas"""
         
-        self.prediction_text.delete(1.0, tk.END)
-        self.prediction_text.insert(1.0, prediction_analysis)
-        
-        # Update factor displays
-        self.skills_match_text.delete(1.0, tk.END)
-        self.skills_match_text.insert(1.0, f"Skills analysis shows {min(95, self.current_analysis.match_score + 10)}% match with job requirements")
-        
-        self.exp_alignment_text.delete(1.0, tk.END)
-        self.exp_alignment_text.insert(1.0, f"Experience alignment score: {max(70, self.current_analysis.match_score - 15)}%")
-        
-        self.market_factors_text.delete(1.0, tk.END)
-        self.market_factors_text.insert(1.0, "Market analysis indicates strong demand for this role type")
+        self._set_text(self.prediction_text, prediction_analysis)
+
+        # Update factor displays with the same precomputed scores
+        self._set_text(
+            self.skills_match_text, f"Skills analysis shows {skills_pct}% match with job requirements")
+        self._set_text(
+            self.exp_alignment_text, f"Experience alignment score: {exp_pct}%")
+        self._set_text(
+            self.market_factors_text, "Market analysis indicates strong demand for this role type")
     
     def export_prediction(self):
         """Export prediction analysis"""
@@ -1142,31 +1824,71 @@ NEXT STEPS:
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
-        if file_path:
-            messagebox.showinfo("Success", f"History exported to {file_path}")
+        if not file_path:
+            return
+        try:
+            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(('date', 'company', 'position', 'status', 'score'))
+                # Generator keeps memory flat: rows stream straight to the
+                # file instead of materializing one big CSV string first
+                writer.writerows(
+                    (job['date'], job['company'], job['position'],
+                     job['status'], job['score'])
+                    for job in self.job_history)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export history: {str(e)}")
+            return
+        messagebox.showinfo("Success", f"History exported to {file_path}")
     
     def import_jobs(self):
-        """Import jobs from file"""
+        """Import job URLs from file and analyze them as a batch"""
         file_path = filedialog.askopenfilename(
             title="Import jobs",
             filetypes=[("JSON files", "*.json"), ("CSV files", "*.csv"), ("All files", "*.*")]
         )
-        if file_path:
-            messagebox.showinfo("Success", "Jobs imported successfully")
+        if not file_path:
+            return
+        try:
+            urls = []
+            if file_path.lower().endswith('.json'):
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    for entry in json.load(f):
+                        urls.append(entry['url'] if isinstance(entry, dict) else str(entry))
+            else:
+                # Plain text or CSV: one URL per line, first column
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        url = line.split(',')[0].strip()
+                        if url.startswith('http'):
+                            urls.append(url)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to import jobs: {str(e)}")
+            return
+        self.analyze_jobs_batch(urls)
     
     def on_history_double_click(self, event):
         """Handle double-click on history item"""
         selection = self.history_tree.selection()
-        if selection:
-            item = self.history_tree.item(selection[0])
-            values = item['values']
-            company = values[1]
-            position = values[2]
-            
-            # Find the job in history
-            for job in self.job_history:
-                if job['company'] == company and job['position'] == position:
-                    details = f"""Job Analysis Details:
+        if not selection:
+            return
+        # Row iids are history entry ids, so no value-based searching
+        job_id = selection[0]
+        job = self._history_by_id.get(job_id)
+        if job is None:
+            return
+
+        summary = 'Analysis details not available'
+        if job.get('skill_analysis'):
+            summary = job['skill_analysis']
+        else:
+            # Deserialize the stored payload only now that the row is open
+            row = self._history_db.execute(
+                "SELECT payload FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row and row[0]:
+                summary = json.loads(row[0]).get('skill_analysis', summary)
+
+        details = f"""Job Analysis Details:
 
 Company: {job['company']}
 Position: {job['position']}
@@ -1175,11 +1897,9 @@ Match Score: {job['score']}/100
 Status: {job['status']}
 
 Analysis Summary:
-{job['analysis'].skill_analysis if hasattr(job['analysis'], 'skill_analysis') else 'Analysis details not available'}"""
-                    
-                    self.job_details_display.delete(1.0, tk.END)
-                    self.job_details_display.insert(1.0, details)
-                    break
+{summary}"""
+
+        self._set_text(self.job_details_display, details)
     
     def save_api_settings(self):
         """Save API settings"""
@@ -1207,6 +1927,9 @@ Analysis Summary:
         """Clear job history"""
         if messagebox.askyesno("Confirm", "Are you sure you want to clear all job history?"):
             self.job_history.clear()
+            self._history_by_id.clear()
+            self._history_db.execute("DELETE FROM jobs")
+            self._history_db.commit()
             self.refresh_history_display()
             messagebox.showinfo("Success", "Job history cleared")
     
@@ -1218,7 +1941,12 @@ Analysis Summary:
     def load_session_data(self):
         """Load previous session data"""
         try:
-            # Load any saved session data
+            # Rebuild the analysis cache saved by save_analysis
+            if os.path.exists(CACHE_FILE):
+                with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+                    for cache_key, fields in json.load(f).items():
+                        self._analysis_cache[cache_key] = JobAnalysis(**fields)
+            self._load_history()
             self.log_integration_activity("Session data loaded successfully")
         except:
             self.log_integration_activity("Starting fresh session - no previous data found")
@@ -1229,6 +1957,10 @@ Analysis Summary:
             self.root.mainloop()
         except Exception as e:
             messagebox.showerror("Critical Error", f"Application error: {str(e)}")
+        finally:
+            # Ask the engine worker to exit cleanly with the window
+            if self._worker is not None and self._worker.is_alive():
+                self._req_q.put(None)
 
 def main():
     """Main entry point"""
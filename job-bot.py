@@ -11,25 +11,212 @@ No command line arguments needed - totally interactive!
 
 import os
 import sys
+import functools
+import hashlib
 import json
 import re
+import time
+import string
+import threading
 from datetime import datetime
 from urllib.parse import urlparse
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-# Required imports
+# orjson serializes a few-KB dict several times faster than stdlib json
+# and emits bytes directly; purely optional, stdlib json is the fallback
 try:
-    import requests
-    from bs4 import BeautifulSoup
+    import orjson
 except ImportError:
-    print("Installing required packages...")
-    os.system("pip install beautifulsoup4 requests")
-    import requests
-    from bs4 import BeautifulSoup
+    orjson = None
+
+# requests and bs4 cost a noticeable fraction of a second to import on
+# a cold launch; loaded lazily on the first real scrape so the welcome
+# banner and URL prompt appear instantly
+requests = None
+BeautifulSoup = None
+BS_PARSER = None
+SESSION = None
+_IMPORT_LOCK = threading.Lock()
+
+def _lazy_import():
+    """Load the scraping stack (and build the session) on first use.
+
+    Thread-safe: batch mode calls this from several pool threads at
+    once, and the guard checks SESSION - the last global assigned - so
+    nobody can slip past while another thread is mid-setup.
+    """
+    global requests, BeautifulSoup, BS_PARSER, SESSION
+    if SESSION is not None:
+        return
+    with _IMPORT_LOCK:
+        if SESSION is not None:
+            return
+        _do_import()
+
+def _do_import():
+    """Lock-protected body of _lazy_import"""
+    global requests, BeautifulSoup, BS_PARSER, SESSION
+
+    # find_spec tells us exactly which packages are missing, so pip only
+    # runs when something genuinely needs installing, via this same
+    # interpreter rather than whatever pip the shell finds first
+    import importlib.util
+    missing = [pkg for pkg, module in
+               (('requests', 'requests'), ('beautifulsoup4', 'bs4'),
+                ('lxml', 'lxml'))
+               if importlib.util.find_spec(module) is None]
+    if missing:
+        print(f"Installing required packages: {', '.join(missing)}...")
+        import subprocess
+        try:
+            subprocess.run(
+                [sys.executable, '-m', 'pip', 'install', '--quiet'] + missing,
+                check=True)
+        except subprocess.CalledProcessError:
+            # lxml is optional; requests/bs4 failures surface on import
+            print("Package installation failed - trying to continue...")
+
+    import requests as _requests
+    from bs4 import BeautifulSoup as _BeautifulSoup
+    requests = _requests
+    BeautifulSoup = _BeautifulSoup
+
+    # lxml parses big job pages several times faster than the
+    # pure-Python parser; fall back quietly when it isn't installed
+    try:
+        import lxml  # noqa: F401
+        BS_PARSER = 'lxml'
+    except ImportError:
+        BS_PARSER = 'html.parser'
+
+    # One session for the whole run: keep-alive connections mean repeat
+    # scrapes on the same job board skip the TCP+TLS handshake. Built
+    # fully before the SESSION assignment that opens the fast-path guard.
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    SESSION = session
+
+# Keywords that drive template and Memory Platform phrasing, found in a
+# single C-level scan of the description instead of one full-text pass
+# per word
+_INFRA_WORDS = frozenset(['infrastructure', 'server', 'network', 'uptime'])
+_AUTO_WORDS = frozenset(['automation', 'python', 'script', 'devops'])
+_KEYWORD_SCAN = re.compile(
+    '|'.join(sorted(_INFRA_WORDS | _AUTO_WORDS | {'data'}, key=len, reverse=True)))
+
+# Selector lists hoisted to module scope so each scrape reuses the same
+# tuples (and BS4's cached compiled selectors) instead of rebuilding them
+TITLE_SELECTORS = ('h1', '[data-testid="jobTitle"]', '.job-title',
+                   '.jobsearch-JobInfoHeader-title')
+COMPANY_SELECTORS = ('.company-name', '[data-testid="companyName"]',
+                     '.jobsearch-InlineCompanyRating')
+
+# Known boards keyed by host suffix to their stable (title, company)
+# selectors - hitting the right selector first skips most of the
+# generic sweep and avoids wrong-element matches on these sites
+DOMAIN_SELECTORS = {
+    'linkedin.com': ('.top-card-layout__title', '.topcard__org-name-link'),
+    'indeed.com': ('.jobsearch-JobInfoHeader-title', '[data-testid="companyName"]'),
+    'greenhouse.io': ('.app-title', '.company-name'),
+    'lever.co': ('.posting-headline h2', '.main-header-text'),
+}
+
+# Containers job boards use for the posting body, most specific first -
+# keyword matching only needs this text, not the whole page
+DESC_SELECTORS = (
+    '[data-testid="jobDescriptionText"]',
+    '#jobDescriptionText',
+    '.description__text',
+    'article',
+)
+
+# Filename sanitizer patterns, compiled once instead of per save
+_NONWORD = re.compile(r'[^\w\s-]')
+_DASHSPACE = re.compile(r'[-\s]+')
+
+# The letter body is constant; parsing it into a Template once at import
+# makes each generation a single substitution pass instead of assembling
+# a large f-string every time
+COVER_LETTER_TEMPLATE = string.Template("""Dear Hiring Manager,
+
+As an Infrastructure Engineer with 3+ years maintaining 99.8% uptime, I'm excited to apply for the $title position at $company.
+
+My background uniquely positions me for this role:
+
+• Infrastructure Foundation: Linux/Windows server management with focus on reliability and monitoring
+• Automation Growth: Python development including GitHub API integration and content generation systems
+• Current Learning: Building Memory Platform - AI-powered family connection app with data analysis components
+
+$memory_connection
+
+Recent accomplishments that demonstrate my Infrastructure → AI transition:
+• GitHub Development Logger Bot (Python, APIs, content automation)
+• Memory Platform development (AI, data processing, user experience)
+• Infrastructure monitoring with 99.8% uptime achievement
+
+Like my current project building the Memory Platform (an AI-powered family connection app), I approach challenges by combining solid infrastructure knowledge with innovative automation solutions.
+
+I'd welcome the opportunity to discuss how my infrastructure expertise and growing automation skills can contribute to $company's success.
+
+Best regards,
+Trey
+
+Portfolio: https://tanarius.github.io
+GitHub: https://github.com/Tanarius
+Memory Platform: AI-powered family connections through technology""")
+
+# Title, company and description sit near the top of job pages; capping
+# the download keeps multi-MB boards from costing a full-body transfer
+MAX_FETCH_BYTES = 512 * 1024
+_FETCH_CHUNK = 64 * 1024
+
+# Output folder made once at startup instead of a stat+mkdir per save
+APPS_DIR = Path("Generated_Applications")
+APPS_DIR.mkdir(exist_ok=True)
+
+# Scraped pages are cached on disk for a day, so re-running the bot on
+# the same URL skips the network and parse entirely
+CACHE_DIR = APPS_DIR / ".cache"
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+def _cache_path(url):
+    """Cache file for one URL"""
+    return CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+def _cache_load(url):
+    """Return the cached job data for url, or None if absent/stale"""
+    path = _cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime < CACHE_TTL_SECONDS:
+            return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _cache_store(url, job_data):
+    """Best-effort write of scraped job data to the disk cache"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(url).write_text(
+            json.dumps(job_data, ensure_ascii=False), encoding='utf-8')
+    except OSError:
+        pass
+
+# One-time shell call enables VT escape handling in the Windows console,
+# after which clear_screen never has to spawn a child process
+if os.name == 'nt':
+    os.system('')
 
 def clear_screen():
     """Clear screen for better UX"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # ANSI clear-and-home: instant, no cls/clear subprocess per loop
+    sys.stdout.write('\x1b[2J\x1b[H')
+    sys.stdout.flush()
 
 def print_welcome():
     """Welcome message"""
@@ -42,64 +229,118 @@ def print_welcome():
     print("=" * 65)
     print()
 
-def get_job_url():
-    """Get job URL from user"""
+def get_job_urls():
+    """Get one or several job URLs from user"""
     print("STEP 1: Find a job posting online")
-    print("STEP 2: Copy the URL from your browser") 
+    print("STEP 2: Copy the URL from your browser")
     print("STEP 3: Paste it below")
+    print("(Type 'batch' to paste several URLs at once)")
     print()
-    
+
     while True:
         url = input("Paste job URL here: ").strip()
-        
+
         if not url:
             print("Please paste a URL!")
             continue
-            
+
+        if url.lower() == 'batch':
+            print("Paste one URL per line, then an empty line to start:")
+            urls = []
+            while True:
+                line = input().strip()
+                if not line:
+                    break
+                if line.startswith(('http://', 'https://')):
+                    urls.append(line)
+                else:
+                    print(f"Skipping invalid URL: {line}")
+            if urls:
+                return urls
+            print("No valid URLs entered!")
+            continue
+
         if not url.startswith(('http://', 'https://')):
             print("Please enter a valid URL (starting with http/https)")
             continue
-            
-        return url
+
+        return [url]
 
 def scrape_job(url):
     """Simple job scraping"""
+    cached = _cache_load(url)
+    if cached is not None:
+        print("Using cached job posting...")
+        return cached
+
     try:
+        _lazy_import()
         print("Reading job posting...")
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(url, headers=headers, timeout=15)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = SESSION.get(url, timeout=15, stream=True)
+        try:
+            # Stream until the cap, then stop reading the socket - both
+            # parsers handle a truncated tail fine
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(_FETCH_CHUNK):
+                chunks.append(chunk)
+                received += len(chunk)
+                if received >= MAX_FETCH_BYTES:
+                    break
+        finally:
+            response.close()
+        soup = BeautifulSoup(b''.join(chunks), BS_PARSER)
         
         # Extract basic info
         title = "Job Position"
         company = "Company"
-        
+
+        # Known hosts get their board-specific selector tried first; the
+        # generic sweep stays as the fallback for everything else
+        host = urlparse(url).netloc.lower()
+        domain_sel = next(
+            (sel for suffix, sel in DOMAIN_SELECTORS.items()
+             if host == suffix or host.endswith('.' + suffix)), None)
+        title_selectors = TITLE_SELECTORS
+        company_selectors = COMPANY_SELECTORS
+        if domain_sel:
+            title_selectors = (domain_sel[0],) + TITLE_SELECTORS
+            company_selectors = (domain_sel[1],) + COMPANY_SELECTORS
+
         # Try to find title
-        title_selectors = ['h1', '[data-testid="jobTitle"]', '.job-title', '.jobsearch-JobInfoHeader-title']
         for selector in title_selectors:
             element = soup.select_one(selector)
             if element and element.get_text().strip():
                 title = element.get_text().strip()
                 break
-        
+
         # Try to find company
-        company_selectors = ['.company-name', '[data-testid="companyName"]', '.jobsearch-InlineCompanyRating']
         for selector in company_selectors:
             element = soup.select_one(selector)
             if element and element.get_text().strip():
                 company = element.get_text().strip()
                 break
         
-        # Get description for keyword matching
-        description = soup.get_text().lower()
+        # Get description for keyword matching - prefer the description
+        # container so we lowercase kilobytes, not the whole page
+        desc_element = None
+        for selector in DESC_SELECTORS:
+            desc_element = soup.select_one(selector)
+            if desc_element:
+                break
+        if desc_element is None:
+            desc_element = soup.body or soup
+        description = desc_element.get_text(" ", strip=True).lower()
         
-        return {
+        job_data = {
             'title': title,
             'company': company,
             'description': description,
             'url': url
         }
-        
+        _cache_store(url, job_data)
+        return job_data
+
     except Exception as e:
         print(f"Warning: Couldn't fully read job posting: {e}")
         return {
@@ -113,87 +354,97 @@ def generate_cover_letter(job_data):
     """Generate personalized cover letter"""
     
     description = job_data['description']
-    
+
+    # One pass over the description collects every keyword hit; the page
+    # text can be large, so scanning it once beats one scan per word
+    found = set(_KEYWORD_SCAN.findall(description))
+
     # Detect job type based on keywords
-    if any(word in description for word in ['infrastructure', 'server', 'network', 'uptime']):
+    if found & _INFRA_WORDS:
         template = "infrastructure"
-    elif any(word in description for word in ['automation', 'python', 'script', 'devops']):
+    elif found & _AUTO_WORDS:
         template = "automation"
     else:
         template = "general"
-    
+
     # Memory Platform connections based on job type
-    if 'automation' in description:
+    if 'automation' in found:
         memory_connection = "Like building the Memory Platform to automate family connection discovery, I focus on creating systems that solve real problems through intelligent automation."
-    elif 'infrastructure' in description:
+    elif 'infrastructure' in found:
         memory_connection = "The Memory Platform requires solid infrastructure to handle family data securely - same foundation thinking I'd bring to your infrastructure challenges."
-    elif 'data' in description:
+    elif 'data' in found:
         memory_connection = "Memory Platform processes family stories into meaningful insights - similar data transformation skills I'd apply to your business challenges."
     else:
         memory_connection = "My Memory Platform project demonstrates end-to-end thinking: from infrastructure through AI implementation - the comprehensive approach valuable for any technical role."
     
     # Generate cover letter
-    cover_letter = f"""Dear Hiring Manager,
-
-As an Infrastructure Engineer with 3+ years maintaining 99.8% uptime, I'm excited to apply for the {job_data['title']} position at {job_data['company']}.
-
-My background uniquely positions me for this role:
-
-• Infrastructure Foundation: Linux/Windows server management with focus on reliability and monitoring
-• Automation Growth: Python development including GitHub API integration and content generation systems  
-• Current Learning: Building Memory Platform - AI-powered family connection app with data analysis components
+    return _build_letter(job_data['title'], job_data['company'],
+                         memory_connection)
 
-{memory_connection}
+@functools.lru_cache(maxsize=32)
+def _build_letter(title, company, memory_connection):
+    """Substitute one letter; memoized so regenerating the same posting
+    (re-pasted URL, cache hit) is a dict lookup"""
+    return COVER_LETTER_TEMPLATE.substitute(
+        title=title, company=company, memory_connection=memory_connection)
 
-Recent accomplishments that demonstrate my Infrastructure → AI transition:
-• GitHub Development Logger Bot (Python, APIs, content automation)
-• Memory Platform development (AI, data processing, user experience)
-• Infrastructure monitoring with 99.8% uptime achievement
-
-Like my current project building the Memory Platform (an AI-powered family connection app), I approach challenges by combining solid infrastructure knowledge with innovative automation solutions.
+def save_files(job_data, cover_letter):
+    """Save generated content"""
+    apps_folder = APPS_DIR
 
-I'd welcome the opportunity to discuss how my infrastructure expertise and growing automation skills can contribute to {job_data['company']}'s success.
+    # One clock read per save; the filename stamp is plain f-string
+    # formatting rather than a locale-aware strftime pass
+    now = datetime.now()
+    timestamp = (f"{now.year:04d}{now.month:02d}{now.day:02d}"
+                 f"_{now.hour:02d}{now.minute:02d}{now.second:02d}")
+    company_clean = _NONWORD.sub('', job_data['company']).strip()
+    company_clean = _DASHSPACE.sub('_', company_clean)
+    
+    # Write the cover letter on a helper thread so the two disk writes
+    # overlap - total latency is the slower write, not the sum
+    cover_letter_file = apps_folder / f"application_{company_clean}_{timestamp}_cover_letter.txt"
 
-Best regards,
-Trey
+    # write_text hands the whole string to the kernel in one call rather
+    # than dribbling it out through an 8 KiB buffered-file object; any
+    # failure is carried back so it raises here, not in the thread
+    letter_error = []
 
-Portfolio: https://tanarius.github.io
-GitHub: https://github.com/Tanarius
-Memory Platform: AI-powered family connections through technology"""
+    def _write_letter():
+        try:
+            cover_letter_file.write_text(cover_letter, encoding='utf-8')
+        except Exception as e:
+            letter_error.append(e)
 
-    return cover_letter
+    writer = threading.Thread(target=_write_letter)
+    writer.start()
 
-def save_files(job_data, cover_letter):
-    """Save generated content"""
-    # Create applications folder if it doesn't exist
-    apps_folder = Path("Generated_Applications")
-    apps_folder.mkdir(exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    company_clean = re.sub(r'[^\w\s-]', '', job_data['company']).strip()
-    company_clean = re.sub(r'[-\s]+', '_', company_clean)
-    
-    # Save cover letter in the applications folder
-    cover_letter_file = apps_folder / f"application_{company_clean}_{timestamp}_cover_letter.txt"
-    with open(cover_letter_file, 'w', encoding='utf-8') as f:
-        f.write(cover_letter)
-    
     # Save job data
     analysis_file = apps_folder / f"application_{company_clean}_{timestamp}_job_data.json"
-    with open(analysis_file, 'w', encoding='utf-8') as f:
-        output_data = {
-            'job_data': job_data,
-            'cover_letter': cover_letter,
-            'generated_at': datetime.now().isoformat(),
-            'talking_points': [
-                "Infrastructure stability: 99.8% uptime demonstrates reliability you need for critical systems",
-                "Automation development: Built production GitHub integration bot, showing practical API skills", 
-                "AI transition: Actively building Memory Platform using machine learning for data insights",
-                f"Growth mindset: Choosing to transition into AI shows commitment to staying current - exactly what {job_data['company']} needs"
-            ]
-        }
-        json.dump(output_data, f, indent=2)
-    
+    output_data = {
+        'job_data': job_data,
+        'cover_letter': cover_letter,
+        'generated_at': now.isoformat(),
+        'talking_points': [
+            "Infrastructure stability: 99.8% uptime demonstrates reliability you need for critical systems",
+            "Automation development: Built production GitHub integration bot, showing practical API skills",
+            "AI transition: Actively building Memory Platform using machine learning for data insights",
+            f"Growth mindset: Choosing to transition into AI shows commitment to staying current - exactly what {job_data['company']} needs"
+        ]
+    }
+    # ensure_ascii=False keeps non-ASCII text as-is instead of paying
+    # for \uXXXX escaping on every character; serializing to one string
+    # makes the write below a single call too
+    if orjson is not None:
+        analysis_file.write_bytes(
+            orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+    else:
+        analysis_file.write_text(
+            json.dumps(output_data, indent=2, ensure_ascii=False),
+            encoding='utf-8')
+
+    writer.join()
+    if letter_error:
+        raise letter_error[0]
     return str(cover_letter_file), str(analysis_file)
 
 def display_results(job_data, cover_letter, files):
@@ -231,7 +482,8 @@ def display_results(job_data, cover_letter, files):
     if choice in ['y', 'yes']:
         try:
             import subprocess
-            subprocess.run(['explorer', 'Generated_Applications'], check=True)
+            # Popen returns immediately; no reason to block on explorer
+            subprocess.Popen(['explorer', 'Generated_Applications'])
         except:
             print("Could not open folder automatically")
 
@@ -253,21 +505,30 @@ def main():
             clear_screen()
             print_welcome()
             
-            # Get job URL
-            url = get_job_url()
-            
+            # Get job URLs (one, or a whole batch)
+            urls = get_job_urls()
+
             print()
-            # Process job
-            job_data = scrape_job(url)
-            
-            print("Generating personalized cover letter...")
-            cover_letter = generate_cover_letter(job_data)
-            
-            print("Saving files...")
-            files = save_files(job_data, cover_letter)
-            
-            # Show results
-            display_results(job_data, cover_letter, files)
+            # Scrapes are network-bound, so a batch runs them in
+            # parallel and finishes in roughly one page-load
+            if len(urls) == 1:
+                jobs = [scrape_job(urls[0])]
+            else:
+                print(f"Reading {len(urls)} job postings in parallel...")
+                # Size the pool to the batch so a two-URL run doesn't
+                # spin up eight threads
+                with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+                    jobs = list(executor.map(scrape_job, urls))
+
+            for job_data in jobs:
+                print("Generating personalized cover letter...")
+                cover_letter = generate_cover_letter(job_data)
+
+                print("Saving files...")
+                files = save_files(job_data, cover_letter)
+
+                # Show results
+                display_results(job_data, cover_letter, files)
             
             # Ask for another
             if not ask_another():
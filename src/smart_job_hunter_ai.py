@@ -32,6 +32,97 @@ try:
 except ImportError:
     openai.api_key = os.getenv("OPENAI_API_KEY")
 
+# Extraction patterns compiled once at import - these run on every
+# scraped posting, so the methods iterate compiled objects instead of
+# sending pattern strings (and flags) back through re's cache per call
+_REQ_PATTERNS = [re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r'requirements?:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
+    r'qualifications?:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
+    r'must have:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
+    r'required skills?:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
+)]
+
+_SKILL_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+\+?\s*years?\s*(?:of\s*)?experience\s*(?:with\s*)?[\w\s,]+)',
+    r'(bachelor\'?s?\s*(?:degree)?(?:\s*in\s*[\w\s]+)?)',
+    r'(master\'?s?\s*(?:degree)?(?:\s*in\s*[\w\s]+)?)',
+    r'(experience\s*(?:with|in)\s*[\w\s,]+)',
+    r'(proficient\s*(?:with|in)\s*[\w\s,]+)',
+    r'(knowledge\s*of\s*[\w\s,]+)',
+)]
+
+_PREF_PATTERNS = [re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r'preferred:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
+    r'nice to have:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
+    r'bonus:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
+    r'plus:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
+)]
+
+_VALUE_PATTERNS = [re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r'values?:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
+    r'culture:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
+    r'we believe:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
+)]
+
+_SALARY_PATTERNS = [re.compile(p) for p in (
+    r'\$[\d,]+\s*-\s*\$[\d,]+',
+    r'\$[\d,]+[kK]?\s*-\s*\$[\d,]+[kK]?',
+    r'[\d,]+\s*-\s*[\d,]+\s*(USD|dollars)',
+)]
+
+_BULLET_SPLIT = re.compile(r'[•\n\-\*]')
+_VALUE_SPLIT = re.compile(r'[,•\n\-]')
+_WHITESPACE = re.compile(r'\s+')
+
+def _keyword_scanner(terms):
+    """One-pass scanner for a set of literal keywords.
+
+    The lookahead alternation reports every keyword occurrence in a
+    single walk of the text - same hits as running a substring check
+    per keyword, without rescanning the page once per term.
+    """
+    alternation = '|'.join(
+        re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    return re.compile('(?=(' + alternation + '))')
+
+# Keyword tables for the classification extractors, shared with their
+# single-pass scanners instead of rebuilt per call
+_JOB_TYPE_TERMS = {
+    'remote': ('remote', '100% remote', 'fully remote', 'work from home'),
+    'hybrid': ('hybrid', 'flexible', 'some remote'),
+}
+_JOB_TYPE_SCAN = _keyword_scanner(
+    {term for terms in _JOB_TYPE_TERMS.values() for term in terms})
+
+_INDUSTRY_KEYWORDS = {
+    'technology': ['software', 'tech', 'saas', 'platform', 'api', 'cloud', 'ai', 'ml'],
+    'finance': ['bank', 'financial', 'fintech', 'trading', 'investment'],
+    'healthcare': ['health', 'medical', 'hospital', 'pharmaceutical'],
+    'ecommerce': ['ecommerce', 'retail', 'marketplace', 'shopping'],
+    'enterprise': ['enterprise', 'b2b', 'corporate', 'business solutions'],
+    'startup': ['startup', 'early stage', 'seed', 'venture'],
+    'consulting': ['consulting', 'advisory', 'professional services']
+}
+_INDUSTRY_SCAN = _keyword_scanner(
+    {kw for kws in _INDUSTRY_KEYWORDS.values() for kw in kws})
+
+_SIZE_INDICATORS = {
+    'startup': ['startup', 'early stage', '1-10 employees', '11-50 employees'],
+    'small': ['small', '51-200 employees', '201-500 employees'],
+    'medium': ['medium', '501-1000 employees', '1001-5000 employees'],
+    'large': ['large', '5001-10000 employees', 'enterprise', 'fortune'],
+    'very_large': ['10000+ employees', 'multinational', 'global']
+}
+_SIZE_SCAN = _keyword_scanner(
+    {ind for inds in _SIZE_INDICATORS.values() for ind in inds})
+
+_CULTURE_TERMS = (
+    'collaborative', 'innovative', 'fast-paced', 'dynamic', 'flexible',
+    'learning', 'growth', 'mentorship', 'autonomous', 'independent',
+    'team-oriented', 'results-driven', 'data-driven', 'customer-focused'
+)
+_CULTURE_SCAN = _keyword_scanner(_CULTURE_TERMS)
+
 @dataclass
 class JobAnalysis:
     """Complete analysis of a job opportunity"""
@@ -318,7 +409,7 @@ class SmartJobHunterAI:
             if element and element.get_text().strip():
                 title = element.get_text().strip()
                 # Clean up title
-                title = re.sub(r'\s+', ' ', title)
+                title = _WHITESPACE.sub(' ', title)
                 return title
         
         # Fallback: extract from URL or page title
@@ -344,7 +435,7 @@ class SmartJobHunterAI:
             if element and element.get_text().strip():
                 company = element.get_text().strip()
                 # Clean company name
-                company = re.sub(r'\s+', ' ', company)
+                company = _WHITESPACE.sub(' ', company)
                 return company
         
         return "Company"
@@ -388,15 +479,9 @@ class SmartJobHunterAI:
     
     def extract_salary_info(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract salary information if available"""
-        salary_patterns = [
-            r'\$[\d,]+\s*-\s*\$[\d,]+',
-            r'\$[\d,]+[kK]?\s*-\s*\$[\d,]+[kK]?',
-            r'[\d,]+\s*-\s*[\d,]+\s*(USD|dollars)',
-        ]
-        
         text = soup.get_text()
-        for pattern in salary_patterns:
-            match = re.search(pattern, text)
+        for pattern in _SALARY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group()
         
@@ -405,11 +490,13 @@ class SmartJobHunterAI:
     def extract_job_type(self, soup: BeautifulSoup) -> str:
         """Determine if job is remote, hybrid, or onsite"""
         text = soup.get_text().lower()
-        
-        if any(term in text for term in ['remote', '100% remote', 'fully remote', 'work from home']):
+
+        # One scan of the page text finds every work-model phrase at once
+        found = set(_JOB_TYPE_SCAN.findall(text))
+        if found.intersection(_JOB_TYPE_TERMS['remote']):
             return 'remote'
-        elif any(term in text for term in ['hybrid', 'flexible', 'some remote']):
-            return 'hybrid' 
+        elif found.intersection(_JOB_TYPE_TERMS['hybrid']):
+            return 'hybrid'
         else:
             return 'onsite'
     
@@ -418,37 +505,21 @@ class SmartJobHunterAI:
         requirements = []
         
         # Look for requirements sections
-        req_patterns = [
-            r'requirements?:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
-            r'qualifications?:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
-            r'must have:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
-            r'required skills?:?\s*(.*?)(?=\n\n|\n[A-Z]|$)'
-        ]
-        
         description_lower = description.lower()
-        for pattern in req_patterns:
-            matches = re.finditer(pattern, description_lower, re.IGNORECASE | re.DOTALL)
+        for pattern in _REQ_PATTERNS:
+            matches = pattern.finditer(description_lower)
             for match in matches:
                 req_text = match.group(1)
                 # Split by bullet points or newlines
-                req_items = re.split(r'[•\n\-\*]', req_text)
+                req_items = _BULLET_SPLIT.split(req_text)
                 for item in req_items:
                     item = item.strip()
                     if len(item) > 10 and len(item) < 200:  # Filter reasonable requirements
                         requirements.append(item)
-        
+
         # Also look for common skill mentions
-        skill_patterns = [
-            r'(\d+\+?\s*years?\s*(?:of\s*)?experience\s*(?:with\s*)?[\w\s,]+)',
-            r'(bachelor\'?s?\s*(?:degree)?(?:\s*in\s*[\w\s]+)?)',
-            r'(master\'?s?\s*(?:degree)?(?:\s*in\s*[\w\s]+)?)',
-            r'(experience\s*(?:with|in)\s*[\w\s,]+)',
-            r'(proficient\s*(?:with|in)\s*[\w\s,]+)',
-            r'(knowledge\s*of\s*[\w\s,]+)'
-        ]
-        
-        for pattern in skill_patterns:
-            matches = re.finditer(pattern, description_lower, re.IGNORECASE)
+        for pattern in _SKILL_PATTERNS:
+            matches = pattern.finditer(description_lower)
             for match in matches:
                 req = match.group(1).strip()
                 if len(req) > 10:
@@ -460,19 +531,12 @@ class SmartJobHunterAI:
         """Extract preferred/nice-to-have qualifications"""
         preferred = []
         
-        pref_patterns = [
-            r'preferred:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
-            r'nice to have:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
-            r'bonus:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
-            r'plus:?\s*(.*?)(?=\n\n|\n[A-Z]|$)'
-        ]
-        
         description_lower = description.lower()
-        for pattern in pref_patterns:
-            matches = re.finditer(pattern, description_lower, re.IGNORECASE | re.DOTALL)
+        for pattern in _PREF_PATTERNS:
+            matches = pattern.finditer(description_lower)
             for match in matches:
                 pref_text = match.group(1)
-                pref_items = re.split(r'[•\n\-\*]', pref_text)
+                pref_items = _BULLET_SPLIT.split(pref_text)
                 for item in pref_items:
                     item = item.strip()
                     if len(item) > 10 and len(item) < 200:
@@ -482,20 +546,13 @@ class SmartJobHunterAI:
     
     def identify_industry(self, description: str, company: str) -> str:
         """Identify company industry from job description"""
-        industry_keywords = {
-            'technology': ['software', 'tech', 'saas', 'platform', 'api', 'cloud', 'ai', 'ml'],
-            'finance': ['bank', 'financial', 'fintech', 'trading', 'investment'],
-            'healthcare': ['health', 'medical', 'hospital', 'pharmaceutical'],
-            'ecommerce': ['ecommerce', 'retail', 'marketplace', 'shopping'],
-            'enterprise': ['enterprise', 'b2b', 'corporate', 'business solutions'],
-            'startup': ['startup', 'early stage', 'seed', 'venture'],
-            'consulting': ['consulting', 'advisory', 'professional services']
-        }
-        
         text = (description + ' ' + company).lower()
-        
-        for industry, keywords in industry_keywords.items():
-            if sum(keyword in text for keyword in keywords) >= 2:
+
+        # Single pass over the text collects every industry keyword hit
+        found = set(_INDUSTRY_SCAN.findall(text))
+
+        for industry, keywords in _INDUSTRY_KEYWORDS.items():
+            if sum(keyword in found for keyword in keywords) >= 2:
                 return industry
         
         return 'technology'  # Default for most AI/automation roles
@@ -509,17 +566,12 @@ class SmartJobHunterAI:
             return 'unknown'
             
         text = soup.get_text().lower()
-        
-        size_indicators = {
-            'startup': ['startup', 'early stage', '1-10 employees', '11-50 employees'],
-            'small': ['small', '51-200 employees', '201-500 employees'],
-            'medium': ['medium', '501-1000 employees', '1001-5000 employees'],
-            'large': ['large', '5001-10000 employees', 'enterprise', 'fortune'],
-            'very_large': ['10000+ employees', 'multinational', 'global']
-        }
-        
-        for size, indicators in size_indicators.items():
-            if any(indicator in text for indicator in indicators):
+
+        # Single pass over the page text collects every size indicator
+        found = set(_SIZE_SCAN.findall(text))
+
+        for size, indicators in _SIZE_INDICATORS.items():
+            if any(indicator in found for indicator in indicators):
                 return size
         
         # Try to infer from company name
@@ -683,36 +735,22 @@ class SmartJobHunterAI:
     
     def extract_culture_keywords(self, description: str) -> List[str]:
         """Extract culture-related keywords from job description"""
-        culture_patterns = [
-            'collaborative', 'innovative', 'fast-paced', 'dynamic', 'flexible',
-            'learning', 'growth', 'mentorship', 'autonomous', 'independent',
-            'team-oriented', 'results-driven', 'data-driven', 'customer-focused'
-        ]
-        
-        found_keywords = []
         description_lower = description.lower()
-        
-        for keyword in culture_patterns:
-            if keyword in description_lower:
-                found_keywords.append(keyword)
-        
-        return found_keywords
+
+        # One scan of the description finds every culture keyword; the
+        # list comprehension keeps the original ordering of the terms
+        found = set(_CULTURE_SCAN.findall(description_lower))
+        return [keyword for keyword in _CULTURE_TERMS if keyword in found]
     
     def extract_company_values(self, description: str) -> List[str]:
         """Extract stated company values"""
-        values_patterns = [
-            r'values?:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
-            r'culture:?\s*(.*?)(?=\n\n|\n[A-Z]|$)',
-            r'we believe:?\s*(.*?)(?=\n\n|\n[A-Z]|$)'
-        ]
-        
         values = []
-        for pattern in values_patterns:
-            matches = re.finditer(pattern, description, re.IGNORECASE | re.DOTALL)
+        for pattern in _VALUE_PATTERNS:
+            matches = pattern.finditer(description)
             for match in matches:
                 values_text = match.group(1)
                 # Extract individual values
-                value_items = re.split(r'[,•\n\-]', values_text)
+                value_items = _VALUE_SPLIT.split(values_text)
                 for item in value_items:
                     item = item.strip()
                     if len(item) > 3 and len(item) < 50: